@@ -4,29 +4,148 @@ HPCL-specific endpoints for fleet optimization and analytics
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
-from typing import List, Dict, Any, Optional
-import uuid
+from fastapi.concurrency import run_in_threadpool
+from kombu.exceptions import OperationalError
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
+import asyncio
+import os
 import time
-from datetime import datetime
+import logging
+from datetime import datetime, timedelta
+
+import numpy as np
 
 from ..models.schemas import (
     OptimizationRequest, OptimizationResult, OptimizationRequestResponse,
     HPCLVessel, HPCLPort, MonthlyDemand, HPCLKPIs,
-    HPCLPortListResponse, HPCLFleetResponse, TaskStatus
+    HPCLPortListResponse, HPCLFleetResponse, TaskStatus, VesselStatus,
+    construct_vessel, construct_port
 )
 from ..models.database import (
-    HPCLVesselDB, HPCLPortDB, OptimizationResultDB, TaskDB,
+    HPCLVesselDB, HPCLPortDB, OptimizationResultDB, TaskDB, TaskProgressBuffer,
     check_database_health
 )
-from ..services.cp_sat_optimizer import hpcl_cp_sat_optimizer
+from ..services.cp_sat_optimizer import (
+    HPCLCPSATOptimizer,
+    hpcl_cp_sat_optimizer,
+    warm_start_hints_from_document
+)
 from ..services.distance_calculator import calculate_hpcl_distance_matrix
 from ..services.eeoi_calculator import hpcl_eeoi_calculator
 from ..core.config import get_settings
+from ..core.responses import HPCLORJSONResponse
+from ..core.ids import uuid7, optimization_request_hash
+from ..core.celery_app import HPCLTaskPriority
+from ..tasks.optimization_tasks import optimize_hpcl_fleet_task
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 settings = get_settings()
 
 
+# ==== READ-THROUGH TTL CACHE ====
+# Fleet, port and status data change at human timescales; dashboards poll them
+# constantly. Entries are (expires_at, value) keyed by name, refreshed under a
+# per-key lock so an expiry triggers one database call, not one per waiter.
+
+STATUS_CACHE_TTL_SECONDS = 10.0
+FLEET_CACHE_TTL_SECONDS = 30.0
+PORTS_CACHE_TTL_SECONDS = 300.0
+
+_TTL_CACHE: Dict[str, Tuple[float, Any]] = {}
+_TTL_LOCKS: Dict[str, asyncio.Lock] = {}
+
+
+async def _ttl_cached(key: str, ttl: float, factory: Callable[[], Awaitable[Any]]) -> Any:
+    entry = _TTL_CACHE.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    
+    async with _TTL_LOCKS.setdefault(key, asyncio.Lock()):
+        # Another request may have refreshed the entry while we waited
+        entry = _TTL_CACHE.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        value = await factory()
+        _TTL_CACHE[key] = (time.monotonic() + ttl, value)
+        return value
+
+
+def _ttl_invalidate(key: str) -> None:
+    _TTL_CACHE.pop(key, None)
+
+
+# Stored documents were validated when written, so the cache holds models built
+# with construct_vessel/construct_port rather than full validation
+async def _load_fleet() -> Tuple[List[HPCLVessel], int]:
+    vessels_data, available_vessels_data = await HPCLVesselDB.get_all_vessels_with_availability()
+    return [construct_vessel(v) for v in vessels_data], len(available_vessels_data)
+
+
+async def _load_ports() -> Tuple[List[HPCLPort], List[HPCLPort]]:
+    loading_ports_data, unloading_ports_data = await HPCLPortDB.get_loading_and_unloading_ports()
+    return (
+        [construct_port(p) for p in loading_ports_data],
+        [construct_port(p) for p in unloading_ports_data],
+    )
+
+
+# In-process solve admission: each solve runs CP-SAT with its profile's worker
+# count, so the API process runs one solve per that many cores (at least one)
+# and answers 429 beyond that. A solve holds its slot from the moment it is
+# accepted, so requests arriving before earlier background tasks have started
+# are counted too; the background task releases the slot when it ends.
+_IN_PROCESS_SOLVE_PROFILE = hpcl_cp_sat_optimizer.solver_profile
+_IN_PROCESS_SOLVE_WORKERS = settings.solver_profiles[_IN_PROCESS_SOLVE_PROFILE]["num_workers"]
+_IN_PROCESS_SOLVE_SLOTS = max(1, (os.cpu_count() or 1) // _IN_PROCESS_SOLVE_WORKERS)
+# Accepted in-process solves that have not finished (pending or running)
+_in_process_solves = 0
+# An optimizer solves one model at a time, so concurrent slots each check one
+# out; the shared instance is first, more are created on demand and kept
+_IDLE_OPTIMIZERS: List[HPCLCPSATOptimizer] = [hpcl_cp_sat_optimizer]
+SOLVE_RETRY_AFTER_SECONDS = 30
+
+# Identical /optimize requests reuse a stored solution this fresh
+OPTIMIZE_RESULT_CACHE_MAX_AGE = timedelta(hours=24)
+
+
+def _in_process_solver_full() -> bool:
+    return _in_process_solves >= _IN_PROCESS_SOLVE_SLOTS
+
+
+def _admit_in_process_solve() -> bool:
+    """Take an in-process solve slot if one is free"""
+    global _in_process_solves
+    if _in_process_solver_full():
+        return False
+    _in_process_solves += 1
+    return True
+
+
+def _release_in_process_solve() -> None:
+    global _in_process_solves
+    _in_process_solves -= 1
+
+
+def _solver_busy() -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail="HPCL optimizer is busy with other solves, retry later",
+        headers={"Retry-After": str(SOLVE_RETRY_AFTER_SECONDS)}
+    )
+
+
+async def _cached_fleet() -> Tuple[List[HPCLVessel], int]:
+    """(vessels, available count); one query, availability filtered from the same result"""
+    return await _ttl_cached("fleet", FLEET_CACHE_TTL_SECONDS, _load_fleet)
+
+
+async def _cached_ports() -> Tuple[List[HPCLPort], List[HPCLPort]]:
+    """(loading, unloading) ports from one query, shared by all /ports endpoints"""
+    return await _ttl_cached("ports", PORTS_CACHE_TTL_SECONDS, _load_ports)
+
+
 # ==== HEALTH AND STATUS ENDPOINTS ====
 
 @router.get("/status", tags=["System"])
@@ -34,6 +153,10 @@ async def get_system_status():
     """
     Get HPCL system status and capabilities
     """
+    return await _ttl_cached("status", STATUS_CACHE_TTL_SECONDS, _build_system_status)
+
+
+async def _build_system_status() -> Dict[str, Any]:
     db_health = await check_database_health()
     
     return {
@@ -68,18 +191,17 @@ async def get_hpcl_fleet():
     Get HPCL's 9-vessel coastal tanker fleet
     """
     try:
-        vessels_data = await HPCLVesselDB.get_all_vessels()
-        available_vessels_data = await HPCLVesselDB.get_available_vessels()
-        
-        vessels = [HPCLVessel(**vessel) for vessel in vessels_data]
+        vessels, available_count = await _cached_fleet()
         total_capacity = sum(vessel.capacity_mt for vessel in vessels)
         
-        return HPCLFleetResponse(
+        # Dumped once and rendered by orjson directly, skipping FastAPI's
+        # response_model re-validation of the cached models
+        return HPCLORJSONResponse(HPCLFleetResponse(
             vessels=vessels,
             total_vessels=len(vessels),
-            available_vessels=len(available_vessels_data),
+            available_vessels=available_count,
             total_capacity_mt=total_capacity
-        )
+        ).model_dump())
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve HPCL fleet: {str(e)}")
@@ -108,11 +230,18 @@ async def update_vessel_status(vessel_id: str, status: str, current_port: Option
     """
     Update HPCL vessel operational status
     """
+    # Writes are the validation point: cached reads construct models unchecked
+    try:
+        status = VesselStatus(status).value
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid vessel status: {status}")
+    
     try:
         result = await HPCLVesselDB.update_vessel_status(vessel_id, status, current_port)
         
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail=f"Vessel {vessel_id} not found")
+        _ttl_invalidate("fleet")
         
         return {
             "vessel_id": vessel_id,
@@ -136,17 +265,13 @@ async def get_hpcl_ports():
     Get HPCL's Indian coastal port network (6 loading + 11 unloading)
     """
     try:
-        loading_ports_data = await HPCLPortDB.get_loading_ports()
-        unloading_ports_data = await HPCLPortDB.get_unloading_ports()
-        
-        loading_ports = [HPCLPort(**port) for port in loading_ports_data]
-        unloading_ports = [HPCLPort(**port) for port in unloading_ports_data]
+        loading_ports, unloading_ports = await _cached_ports()
         
-        return HPCLPortListResponse(
+        return HPCLORJSONResponse(HPCLPortListResponse(
             loading_ports=loading_ports,
             unloading_ports=unloading_ports,
             total_ports=len(loading_ports) + len(unloading_ports)
-        )
+        ).model_dump())
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve HPCL ports: {str(e)}")
@@ -158,8 +283,8 @@ async def get_loading_ports():
     Get HPCL's 6 loading ports
     """
     try:
-        ports_data = await HPCLPortDB.get_loading_ports()
-        return [HPCLPort(**port) for port in ports_data]
+        loading_ports, _ = await _cached_ports()
+        return loading_ports
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve loading ports: {str(e)}")
@@ -171,8 +296,8 @@ async def get_unloading_ports():
     Get HPCL's 11 unloading ports
     """
     try:
-        ports_data = await HPCLPortDB.get_unloading_ports()
-        return [HPCLPort(**port) for port in ports_data]
+        _, unloading_ports = await _cached_ports()
+        return unloading_ports
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to retrieve unloading ports: {str(e)}")
@@ -194,7 +319,7 @@ async def calculate_distance_matrix(background_tasks: BackgroundTasks):
             )
         
         # Calculate distance matrix in background
-        task_id = str(uuid.uuid4())
+        task_id = str(uuid7())
         background_tasks.add_task(
             _calculate_distance_matrix_background,
             all_ports_data, task_id
@@ -235,11 +360,32 @@ async def optimize_hpcl_fleet(
     **Response:** Task ID for async processing (typical solve time: 30-300 seconds)
     """
     try:
-        # Validate request against HPCL constraints
-        _validate_hpcl_optimization_request(request)
+        # HPCL limits (demand ports, fleet size, fuel price) are enforced while
+        # parsing OptimizationRequest, so the request is already valid here.
+        
+        # An identical request solved recently against the current fleet and
+        # port records: point the caller at that result
+        vessels_data, (loading_ports_data, unloading_ports_data) = await asyncio.gather(
+            HPCLVesselDB.get_all_vessels(),
+            HPCLPortDB.get_loading_and_unloading_ports()
+        )
+        request_hash = optimization_request_hash(
+            request.model_dump(mode="json"), vessels_data, loading_ports_data + unloading_ports_data
+        )
+        cached = await OptimizationResultDB.get_recent_result_by_hash(request_hash, OPTIMIZE_RESULT_CACHE_MAX_AGE)
+        if cached:
+            return OptimizationRequestResponse(
+                task_id=cached["request_id"],
+                status="cached",
+                estimated_completion_time="0 seconds",
+                message="Identical optimization request already solved. Use task_id to fetch the result."
+            )
+        
+        if not settings.use_celery_optimization and _in_process_solver_full():
+            raise _solver_busy()
         
         # Generate unique task ID
-        task_id = f"hpcl_opt_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        task_id = f"hpcl_opt_{uuid7().hex}"
         
         # Create task record
         await TaskDB.create_task({
@@ -250,11 +396,17 @@ async def optimize_hpcl_fleet(
             "message": "Optimization request received"
         })
         
-        # Start optimization in background
-        background_tasks.add_task(
-            _run_optimization_background,
-            task_id, request
-        )
+        # Hand the solve to a Celery worker when configured, so this API worker
+        # never spends 30-300 s of CPU in CP-SAT; fall back to an in-process
+        # background task if the broker cannot be reached.
+        if not (settings.use_celery_optimization and await _enqueue_optimization_task(task_id, request)):
+            if not _admit_in_process_solve():
+                await TaskDB.update_task_status(task_id, "failed", 0, "Optimizer busy, request rejected")
+                raise _solver_busy()
+            background_tasks.add_task(
+                _run_optimization_background,
+                task_id, request
+            )
         
         return OptimizationRequestResponse(
             task_id=task_id,
@@ -422,7 +574,10 @@ async def get_optimization_result(request_id: str):
         if not result_data:
             raise HTTPException(status_code=404, detail=f"Results for request {request_id} not found")
         
-        return OptimizationResult(**result_data)
+        # Stored results were validated when the solver produced them: construct
+        # without re-validation and render the dump with orjson directly
+        result = OptimizationResult.model_construct(**result_data)
+        return HPCLORJSONResponse(result.model_dump(warnings=False))
         
     except HTTPException:
         raise
@@ -456,20 +611,27 @@ async def get_monthly_kpis(month: str):
         raise HTTPException(status_code=500, detail=f"Failed to calculate KPIs: {str(e)}")
 
 
+# Attribution of estimated savings across categories (shares sum to 1)
+_SAVINGS_SPLIT = (
+    ("fuel_efficiency", 0.4),
+    ("route_optimization", 0.3),
+    ("demurrage_avoidance", 0.2),
+    ("port_efficiency", 0.1),
+)
+
+
 @router.get("/analytics/cost-savings/{month}", tags=["Analytics"])
 async def get_cost_savings_analysis(month: str):
     """
     Analyze HPCL cost savings vs manual planning
     """
     try:
-        results = await OptimizationResultDB.get_results_by_month(month)
+        # Summed by the database; only the scalar crosses the wire
+        total_optimized_cost, result_count = await OptimizationResultDB.get_total_cost_for_month(month)
         
-        if not results:
+        if result_count == 0:
             raise HTTPException(status_code=404, detail=f"No data found for month {month}")
         
-        # Calculate cost savings
-        total_optimized_cost = sum(result.get('total_cost', 0) for result in results)
-        
         # Estimate manual planning cost (typically 20% higher)
         estimated_manual_cost = total_optimized_cost * 1.20
         absolute_savings = estimated_manual_cost - total_optimized_cost
@@ -485,10 +647,7 @@ async def get_cost_savings_analysis(month: str):
             "annual_projection": absolute_savings * 12,
             "analysis_date": datetime.now().isoformat(),
             "savings_breakdown": {
-                "fuel_efficiency": absolute_savings * 0.4,
-                "route_optimization": absolute_savings * 0.3,
-                "demurrage_avoidance": absolute_savings * 0.2,
-                "port_efficiency": absolute_savings * 0.1
+                category: absolute_savings * share for category, share in _SAVINGS_SPLIT
             }
         }
         
@@ -504,28 +663,15 @@ async def calculate_fleet_emissions(optimization_results: List[Dict[str, Any]]):
     Calculate HPCL fleet EEOI emissions for optimization results
     """
     try:
-        # Mock vessel data for calculation (should be retrieved from DB in production)
-        mock_vessels = [
-            HPCLVessel(
-                id=f"hpcl_vessel_{i}",
-                name=f"HPCL Tanker {i}",
-                imo_number=f"IMO{1000000 + i}",
-                capacity_mt=30000,
-                grt=15000,
-                length_m=180,
-                beam_m=25,
-                draft_m=12,
-                speed_knots=14,
-                fuel_consumption_mt_per_day=25,
-                daily_charter_rate=75000
-            ) for i in range(1, 10)
-        ]
-        
-        # Convert results to OptimizationResult format
-        result = OptimizationResult(
+        # Fleet from the TTL cache (same models /fleet serves): nothing is rebuilt per
+        # request, and route vessel_ids match real vessel ids
+        vessels, _ = await _cached_fleet()
+        
+        # Routes stay plain dicts: the EEOI calculator reads them with .get()
+        result = OptimizationResult.model_construct(
             request_id="emissions_calculation",
             month="2025-11",
-            optimization_status="completed",
+            optimization_status="optimal",
             solve_time_seconds=0,
             selected_routes=optimization_results,
             total_cost=sum(r.get('total_cost', 0) for r in optimization_results),
@@ -534,7 +680,7 @@ async def calculate_fleet_emissions(optimization_results: List[Dict[str, Any]]):
         )
         
         # Calculate emissions
-        emissions = hpcl_eeoi_calculator.calculate_fleet_eeoi(result, mock_vessels)
+        emissions = hpcl_eeoi_calculator.calculate_fleet_eeoi(result, vessels)
         
         return {
             "fleet_emissions": emissions,
@@ -548,6 +694,27 @@ async def calculate_fleet_emissions(optimization_results: List[Dict[str, Any]]):
 
 # ==== BACKGROUND TASKS ====
 
+async def _enqueue_optimization_task(task_id: str, request: OptimizationRequest) -> bool:
+    """
+    Publish the optimization to the Celery 'optimization' queue.
+    Returns False when the broker is unreachable.
+    """
+    try:
+        # apply_async is a blocking publish — keep it off the event loop.
+        # Workers solve with the same profile as the in-process path, so a
+        # result does not depend on which path served the request.
+        await run_in_threadpool(
+            optimize_hpcl_fleet_task.apply_async,
+            args=[task_id, request.model_dump(mode="json"), _IN_PROCESS_SOLVE_PROFILE],
+            priority=HPCLTaskPriority.HIGH,
+            retry=False
+        )
+        return True
+    except OperationalError as e:
+        logger.warning("Celery broker unavailable, running optimization %s in-process: %s", task_id, e)
+        return False
+
+
 async def _calculate_distance_matrix_background(ports_data: List[Dict], task_id: str):
     """
     Background task for distance matrix calculation
@@ -567,73 +734,92 @@ async def _calculate_distance_matrix_background(ports_data: List[Dict], task_id:
 
 async def _run_optimization_background(task_id: str, request: OptimizationRequest):
     """
-    Background task for HPCL fleet optimization
+    Background task for HPCL fleet optimization (releases the in-process
+    solve slot the request handler took)
     """
     try:
-        await TaskDB.update_task_status(task_id, "processing", 5, "Loading HPCL fleet data...")
+        optimizer = _IDLE_OPTIMIZERS.pop() if _IDLE_OPTIMIZERS else HPCLCPSATOptimizer(_IN_PROCESS_SOLVE_PROFILE)
+        try:
+            await _optimize_in_background(task_id, request, optimizer)
+        finally:
+            _IDLE_OPTIMIZERS.append(optimizer)
+    finally:
+        _release_in_process_solve()
+
+
+async def _optimize_in_background(
+    task_id: str,
+    request: OptimizationRequest,
+    optimizer: HPCLCPSATOptimizer
+):
+    # Intermediate progress is coalesced; only the terminal state is awaited
+    progress = TaskProgressBuffer(task_id)
+    try:
+        progress.set("processing", 5, "Loading HPCL fleet data...")
+        
+        # Get fleet and ports data, plus the month's last solution to warm-start
+        # CP-SAT — independent queries, issued concurrently
+        vessels_data, (loading_ports_data, unloading_ports_data), previous_result = await asyncio.gather(
+            HPCLVesselDB.get_all_vessels(),
+            HPCLPortDB.get_loading_and_unloading_ports(),
+            OptimizationResultDB.get_latest_solved_result_for_month(request.month)
+        )
         
-        # Get fleet and ports data
-        vessels_data = await HPCLVesselDB.get_all_vessels()
-        loading_ports_data = await HPCLPortDB.get_loading_ports()
-        unloading_ports_data = await HPCLPortDB.get_unloading_ports()
+        # Fingerprint of the request and the fleet/port records being solved,
+        # taken now: in-memory records can change while the solve runs
+        request_hash = optimization_request_hash(
+            request.model_dump(mode="json"), vessels_data, loading_ports_data + unloading_ports_data
+        )
         
         vessels = [HPCLVessel(**vessel) for vessel in vessels_data]
         loading_ports = [HPCLPort(**port) for port in loading_ports_data]
         unloading_ports = [HPCLPort(**port) for port in unloading_ports_data]
         
-        await TaskDB.update_task_status(task_id, "processing", 20, "Generating feasible routes...")
+        progress.set("processing", 20, "Generating feasible routes...")
         
         # Run optimization
-        result = await hpcl_cp_sat_optimizer.optimize_hpcl_fleet(
+        result = await optimizer.optimize_hpcl_fleet(
             vessels=vessels,
             loading_ports=loading_ports,
             unloading_ports=unloading_ports,
             monthly_demands=request.demands,
             fuel_price_per_mt=request.fuel_price_per_mt,
             optimization_objective=request.optimize_for,
-            max_solve_time_seconds=request.max_solve_time_seconds
+            max_solve_time_seconds=request.max_solve_time_seconds,
+            warm_start_hints=warm_start_hints_from_document(previous_result) if previous_result else None
         )
         
-        await TaskDB.update_task_status(task_id, "processing", 90, "Saving optimization results...")
+        progress.set("processing", 90, "Saving optimization results...")
         
-        # Save results
+        # Save results: one dump, shared by the result and task documents.
+        # Stored under the planning month so later solves of it can warm-start.
         result.request_id = task_id
-        result_dict = result.dict()
+        result.month = request.month
+        result_dict = result.model_dump()
+        result_dict["request_hash"] = request_hash
         await OptimizationResultDB.save_result(result_dict)
         
-        await TaskDB.update_task_status(task_id, "completed", 100, "Optimization completed successfully")
+        await progress.finish("completed", 100, "Optimization completed successfully")
         await TaskDB.save_task_result(task_id, result_dict)
         
     except Exception as e:
-        await TaskDB.update_task_status(task_id, "failed", 0, f"Optimization failed: {str(e)}")
+        await progress.finish("failed", 0, f"Optimization failed: {str(e)}")
 
 
 # ==== HELPER FUNCTIONS ====
 
-def _validate_hpcl_optimization_request(request: OptimizationRequest):
-    """
-    Validate optimization request against HPCL constraints
-    """
-    # Check demand ports count
-    if len(request.demands) > settings.hpcl_unloading_ports:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Too many demand ports. HPCL has {settings.hpcl_unloading_ports} unloading ports maximum."
-        )
-    
-    # Check vessel availability
-    if len(request.available_vessels) > settings.hpcl_fleet_size:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Too many vessels specified. HPCL fleet size is {settings.hpcl_fleet_size} vessels."
-        )
-    
-    # Validate fuel price range
-    if not (20000 <= request.fuel_price_per_mt <= 80000):
-        raise HTTPException(
-            status_code=400,
-            detail="Fuel price out of reasonable range (₹20,000 - ₹80,000 per MT)"
-        )
+_KPI_METRIC_FIELDS = (
+    'total_cost', 'total_cargo_mt', 'total_distance_nm',
+    'fleet_utilization', 'demand_satisfaction_rate'
+)
+
+
+def _voyage_hours(result: Dict[str, Any]) -> float:
+    """Total voyage hours of a stored result (route time x executions)"""
+    return sum(
+        route.get('total_time_hours', 0) * (route.get('execution_count', 1) or 0)
+        for route in result.get('selected_routes', [])
+    )
 
 
 def _calculate_monthly_kpis(results: List[Dict[str, Any]], month: str) -> Dict[str, Any]:
@@ -659,13 +845,16 @@ def _calculate_monthly_kpis(results: List[Dict[str, Any]], month: str) -> Dict[s
             "fuel_efficiency": 0.0
         }
     
-    # Aggregate metrics
-    total_cost = sum(result.get('total_cost', 0) for result in results)
-    total_cargo = sum(result.get('total_cargo_mt', 0) for result in results)
-    total_distance = sum(result.get('total_distance_nm', 0) for result in results)
-    
-    avg_fleet_utilization = sum(result.get('fleet_utilization', 0) for result in results) / len(results)
-    avg_demand_satisfaction = sum(result.get('demand_satisfaction_rate', 0) for result in results) / len(results)
+    # One pass builds a (results x metrics) matrix; column sums/means are vectorized
+    metrics = np.array(
+        [
+            [result.get(field, 0) for field in _KPI_METRIC_FIELDS] + [_voyage_hours(result)]
+            for result in results
+        ],
+        dtype=np.float64
+    )
+    total_cost, total_cargo, total_distance, _, _, total_hours = metrics.sum(axis=0).tolist()
+    _, _, _, avg_fleet_utilization, avg_demand_satisfaction, _ = metrics.mean(axis=0).tolist()
     
     return {
         "month": month,
@@ -679,7 +868,8 @@ def _calculate_monthly_kpis(results: List[Dict[str, Any]], month: str) -> Dict[s
         "demurrage_cost": 0.0,
         "avg_voyage_duration": 0.0,  # Would be calculated from vessel schedules
         "avg_loading_time": 0.0,
-        "avg_sailing_speed": round(total_distance / (total_distance / 14), 2) if total_distance > 0 else 0,  # Assume 14 knots avg
+        # Distance-weighted across results: total miles over total voyage hours
+        "avg_sailing_speed": round(total_distance / total_hours, 2) if total_hours > 0 else 0,
         "total_co2_emissions": 0.0,  # Would be calculated from EEOI
         "eeoi_average": 0.0,
         "fuel_efficiency": 0.0
@@ -4,12 +4,39 @@ Background task processing for fleet optimization and analytics
 """
 
 import os
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+import orjson
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import after_setup_logger, worker_process_init
 from kombu import Queue, Exchange
+from kombu.serialization import register
 from ..core.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger('hpcl.celery')
+
+
+# orjson wire format for task args and results: optimization payloads (requests,
+# route lists, result dicts) encode/decode in C. Registered at import so the API
+# (producer) and workers (consumer) agree on it.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _orjson_dumps(obj) -> bytes:
+    return orjson.dumps(obj, option=ORJSON_OPTIONS)
+
+
+register(
+    'orjson',
+    _orjson_dumps,
+    orjson.loads,
+    content_type='application/x-orjson',
+    content_encoding='utf-8'
+)
 
 
 # Configure Celery
@@ -33,7 +60,11 @@ app.conf.update(
         'backend.app.tasks.monitoring_tasks.*': {'queue': 'monitoring'}
     },
     
-    # Task queues
+    # Task queues. CP-SAT parallelizes internally (num_workers per solver
+    # profile), so the optimization queue should get one solve per machine:
+    #   celery -A backend.app.core.celery_app worker -Q optimization -c 1 --pool=solo -n optimizer@%h
+    # analytics/monitoring are I/O bound and keep a prefork pool:
+    #   celery -A backend.app.core.celery_app worker -Q analytics,monitoring -c 4 --pool=prefork
     task_queues=(
         Queue('optimization', Exchange('optimization'), routing_key='optimization',
               queue_arguments={'x-max-priority': 10}),
@@ -44,9 +75,10 @@ app.conf.update(
     ),
     
     # Task execution settings
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    task_serializer='orjson',
+    # json stays accepted for messages queued before the switch
+    accept_content=['orjson', 'json'],
+    result_serializer='orjson',
     timezone='Asia/Kolkata',
     enable_utc=True,
     
@@ -105,6 +137,33 @@ app.conf.update(
     task_max_retries=3,
 )
 
+# Worker logging goes through a queue: tasks only enqueue records and one
+# listener thread per process formats and writes them, so task hooks never
+# contend on the stream lock (same pattern as the API in main.py).
+_log_listener: Optional[QueueListener] = None
+
+
+def _queue_root_logging(handlers: List[logging.Handler]) -> None:
+    global _log_listener
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logging.getLogger().handlers = [QueueHandler(log_queue)]
+    _log_listener.start()
+
+
+@after_setup_logger.connect
+def _setup_queue_logging(logger, **kwargs):
+    _queue_root_logging(logger.handlers)
+
+
+@worker_process_init.connect
+def _restart_queue_logging(**kwargs):
+    # Prefork children inherit the QueueHandler but not the listener thread;
+    # give each child its own queue and listener over the same handlers
+    if _log_listener is not None:
+        _queue_root_logging(list(_log_listener.handlers))
+
+
 # Custom task base class for HPCL-specific tasks
 class HPCLBaseTask(app.Task):
     """
@@ -115,20 +174,20 @@ class HPCLBaseTask(app.Task):
         """
         Error handler for HPCL tasks
         """
-        print(f'HPCL Task {self.name}[{task_id}] failed: {exc}')
+        logger.error('HPCL Task %s[%s] failed: %s', self.name, task_id, exc)
         # Here you could add logging to database or send alerts
     
     def on_retry(self, exc, task_id, args, kwargs, einfo):
         """
         Retry handler for HPCL tasks
         """
-        print(f'HPCL Task {self.name}[{task_id}] retry: {exc}')
+        logger.warning('HPCL Task %s[%s] retry: %s', self.name, task_id, exc)
     
     def on_success(self, retval, task_id, args, kwargs):
         """
         Success handler for HPCL tasks
         """
-        print(f'HPCL Task {self.name}[{task_id}] succeeded')
+        logger.info('HPCL Task %s[%s] succeeded', self.name, task_id)
 
 
 # Set default task base
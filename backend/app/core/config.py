@@ -3,11 +3,24 @@ HPCL Coastal Tanker Optimization - Configuration Settings
 Environment configuration for HPCL-specific settings
 """
 
-from pydantic_settings import BaseSettings
-from typing import List, Optional, Dict, Any
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Final, List, Optional, Dict, Any
+from functools import lru_cache
 import os
 
 
+# List-valued defaults live in immutable module constants; each settings
+# instance gets a fresh list from its default_factory
+DEFAULT_CORS_ORIGINS: Final = (
+    "http://localhost:3000",  # Next.js frontend local
+    "http://localhost:3001",  # Development frontend
+    "http://127.0.0.1:3000",
+    "*"  # Allow all origins for deployment (can be restricted later)
+)
+DEFAULT_API_KEYS: Final = ("hpcl-demo-key", "hpcl-admin-key")
+
+
 class HPCLSettings(BaseSettings):
     """
     HPCL Application Settings
@@ -21,12 +34,7 @@ class HPCLSettings(BaseSettings):
     
     # API Settings
     api_prefix: str = "/api/v1"
-    cors_origins: List[str] = [
-        "http://localhost:3000",  # Next.js frontend local
-        "http://localhost:3001",  # Development frontend
-        "http://127.0.0.1:3000",
-        "*"  # Allow all origins for deployment (can be restricted later)
-    ]
+    cors_origins: List[str] = Field(default_factory=lambda: list(DEFAULT_CORS_ORIGINS))
     frontend_url: Optional[str] = None  # Set via environment variable in production
     
     # Database Settings
@@ -36,10 +44,13 @@ class HPCLSettings(BaseSettings):
     
     # Redis Settings (for Celery)
     redis_url: str = "redis://localhost:6379/0"
+    # Dispatch /optimize solves to the Celery 'optimization' queue instead of
+    # the API process. Workers must share MongoDB with the API for polling.
+    use_celery_optimization: bool = False
     
     # Security Settings
     secret_key: str = "hpcl-coastal-optimizer-super-secret-key-change-in-production"
-    api_keys: List[str] = ["hpcl-demo-key", "hpcl-admin-key"]
+    api_keys: List[str] = Field(default_factory=lambda: list(DEFAULT_API_KEYS))
     
     # HPCL Fleet Configuration
     hpcl_fleet_size: int = 9
@@ -56,6 +67,7 @@ class HPCLSettings(BaseSettings):
     # Solver Configuration
     solver_num_workers: int = 4  # Number of parallel search workers
     solver_log_progress: bool = True  # Log search progress
+    solver_greedy_warm_start: bool = True  # Hint CP-SAT with greedy route counts when no previous solution is given
     
     # Solver Profiles (Quick, Optimal)
     solver_profiles: Dict[str, Dict[str, Any]] = {
@@ -66,7 +78,9 @@ class HPCLSettings(BaseSettings):
         },
         "optimal": {
             "max_time_seconds": 600,
-            "num_workers": 8,
+            # CP-SAT's portfolio is tuned for 16 workers (generic search + LNS);
+            # never more than the machine has cores
+            "num_workers": min(16, os.cpu_count() or 8),
             "description": "Maximum quality — provably minimum cost"
         }
     }
@@ -95,24 +109,23 @@ class HPCLSettings(BaseSettings):
     log_level: str = "INFO"
     enable_request_logging: bool = True
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    # Frozen: get_settings() shares one instance process-wide, so fields are
+    # read-only and an accidental assignment raises instead of leaking
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True
+    )
 
 
 # Global settings instance
-_settings: Optional[HPCLSettings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> HPCLSettings:
     """
-    Get application settings (singleton pattern)
+    Get application settings (singleton: environment parsed and validated once)
     """
-    global _settings
-    if _settings is None:
-        _settings = HPCLSettings()
-    return _settings
+    return HPCLSettings()
 
 
 # HPCL-Specific Constants
@@ -123,15 +136,16 @@ class HPCLConstants:
     
     # Fleet Specifications
     FLEET_SIZE = 9
-    LOADING_PORTS = [
+    # frozensets: these are membership tables (O(1) `in`), not ordered lists
+    LOADING_PORTS = frozenset({
         "mumbai", "kandla", "cochin", 
         "vishakhapatnam", "haldia", "paradip"
-    ]
-    UNLOADING_PORTS = [
+    })
+    UNLOADING_PORTS = frozenset({
         "chennai", "tuticorin", "mangalore", "new_mangalore",
         "karwar", "mormugao", "ratnagiri", "nhava_sheva",
         "hazira", "sikka", "okha"
-    ]
+    })
     
     # Operational Constraints
     SINGLE_LOADING_RULE = True
@@ -175,8 +189,12 @@ class HPCLConstants:
         discharge_ports = kwargs.get('discharge_ports', 0)
         loading_ports = kwargs.get('loading_ports', 0)
         
-        return (
-            vessel_count <= cls.FLEET_SIZE and
-            discharge_ports <= cls.MAX_DISCHARGE_PORTS and
-            loading_ports == 1 if cls.SINGLE_LOADING_RULE else True
-        )
+        # Each rule exits on its own; the conditional applies only to the
+        # single-loading rule, not to the whole chain
+        if discharge_ports > cls.MAX_DISCHARGE_PORTS:
+            return False
+        if cls.SINGLE_LOADING_RULE and loading_ports != 1:
+            return False
+        if vessel_count > cls.FLEET_SIZE:
+            return False
+        return True
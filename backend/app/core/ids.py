@@ -0,0 +1,73 @@
+"""
+HPCL Coastal Tanker Optimization - Identifiers
+Time-ordered UUIDv7 generation for task ids and optimization request fingerprints
+"""
+
+import hashlib
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List
+
+import orjson
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_seq = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    RFC 9562 UUIDv7: 48-bit Unix milliseconds, then random bits.
+
+    Ids sort by creation time, so Mongo index inserts land on the rightmost
+    B-tree page instead of scattering like uuid4. Within one millisecond the
+    12-bit rand_a field is used as a counter (RFC 9562 method 1), keeping ids
+    from this process strictly increasing.
+    """
+    global _last_ms, _last_seq
+    rand = int.from_bytes(os.urandom(10), "big")
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            _last_seq = rand >> 69  # random start in the lower half leaves counter headroom
+        else:
+            _last_seq += 1
+            if _last_seq > 0xFFF:
+                # Counter exhausted: borrow the next millisecond
+                _last_ms += 1
+                _last_seq = 0
+        ms, seq = _last_ms, _last_seq
+
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= seq << 64
+    value |= 0b10 << 62
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=value)
+
+
+def optimization_request_hash(
+    request_data: Dict[str, Any],
+    vessels: List[Dict[str, Any]],
+    ports: List[Dict[str, Any]]
+) -> str:
+    """
+    Fingerprint of an optimization request (its JSON-mode dump) together with
+    the vessel and port records it is solved against. Identical requests over
+    the same fleet state hash equal regardless of key or record order, so a
+    stored result can be reused instead of re-solving; any vessel or port
+    change (e.g. a vessel going to maintenance) yields a new hash.
+    """
+    payload = orjson.dumps(
+        {
+            "request": request_data,
+            "vessels": sorted(vessels, key=lambda v: str(v.get("id"))),
+            "ports": sorted(ports, key=lambda p: str(p.get("id")))
+        },
+        default=str,  # Mongo ObjectIds
+        option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
@@ -0,0 +1,26 @@
+"""
+HPCL Coastal Tanker Optimization - Response Classes
+orjson-backed JSON responses for large optimizer payloads
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class HPCLORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Serializes dicts, datetimes and NumPy arrays/scalars in C. Endpoints that
+    return an instance of this class directly also skip FastAPI's
+    jsonable_encoder walk over the payload.
+    """
+
+    media_type = "application/json"
+    # Shared with code that pre-serializes bodies, so cached bytes match render()
+    orjson_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self.orjson_options)
@@ -1,12 +1,72 @@
 """
 HPCL Challenge 7.1 - Exact Specification Data
 Coastal Vessel Optimization - Minimizing Bulk Cargo Transportation Cost
+
+The PS tables are static, so every getter is memoized: the literals are built
+on first call and the same objects are returned afterwards. Treat results as
+read-only; callers that need to modify them (e.g. database seeding) copy first.
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 
+import numpy as np
+
+
+# Hull specification shared by each PS tanker class; vessels differ only in
+# identity and charter rate. Read-only views, copied into each vessel dict.
+_TANKER_50K = MappingProxyType({
+    "capacity_mt": 50000,
+    "grt": 25000,
+    "length_m": 200,
+    "beam_m": 32,
+    "draft_m": 12.0,
+    "speed_knots": 14.0,
+    "fuel_consumption_mt_per_day": 25.0,
+    "crew_size": 20,
+})
+_TANKER_25K = MappingProxyType({
+    "capacity_mt": 25000,
+    "grt": 12500,
+    "length_m": 150,
+    "beam_m": 24,
+    "draft_m": 10.0,
+    "speed_knots": 13.0,
+    "fuel_consumption_mt_per_day": 15.0,
+    "crew_size": 18,
+})
 
+
+def _tanker(
+    vessel_id: str,
+    imo_number: str,
+    hull: MappingProxyType,
+    charter_rate_display_cr_per_day: float,
+    daily_charter_rate: int
+) -> Dict[str, Any]:
+    """One PS fleet row, keys in the table's published order"""
+    return {
+        "id": vessel_id,
+        "name": f"Tanker {vessel_id}",
+        "imo_number": imo_number,
+        "capacity_mt": hull["capacity_mt"],
+        "charter_rate_display_cr_per_day": charter_rate_display_cr_per_day,  # Display only (Rs Cr/day). DO NOT use in cost calculations.
+        "daily_charter_rate": daily_charter_rate,  # Rs per day — the ONLY field used in cost = rate × days
+        "grt": hull["grt"],
+        "length_m": hull["length_m"],
+        "beam_m": hull["beam_m"],
+        "draft_m": hull["draft_m"],
+        "speed_knots": hull["speed_knots"],
+        "fuel_consumption_mt_per_day": hull["fuel_consumption_mt_per_day"],
+        "crew_size": hull["crew_size"],
+        "status": "available",
+        "current_port": None
+    }
+
+
+@lru_cache(maxsize=1)
 def get_challenge_vessels() -> List[Dict[str, Any]]:
     """
     9 Coastal Tankers as per Challenge 7.1
@@ -14,162 +74,19 @@ def get_challenge_vessels() -> List[Dict[str, Any]]:
     - T8-T9: 25,000 MT capacity
     """
     return [
-        {
-            "id": "T1",
-            "name": "Tanker T1",
-            "imo_number": "IMO1000001",
-            "capacity_mt": 50000,
-            "charter_rate_display_cr_per_day": 0.63,  # Display only (Rs Cr/day). DO NOT use in cost calculations.
-            "daily_charter_rate": 6300000,  # Rs per day — the ONLY field used in cost = rate × days
-            "grt": 25000,
-            "length_m": 200,
-            "beam_m": 32,
-            "draft_m": 12.0,
-            "speed_knots": 14.0,
-            "fuel_consumption_mt_per_day": 25.0,
-            "crew_size": 20,
-            "status": "available",
-            "current_port": None
-        },
-        {
-            "id": "T2",
-            "name": "Tanker T2",
-            "imo_number": "IMO1000002",
-            "capacity_mt": 50000,
-            "charter_rate_display_cr_per_day": 0.49,
-            "daily_charter_rate": 4900000,
-            "grt": 25000,
-            "length_m": 200,
-            "beam_m": 32,
-            "draft_m": 12.0,
-            "speed_knots": 14.0,
-            "fuel_consumption_mt_per_day": 25.0,
-            "crew_size": 20,
-            "status": "available",
-            "current_port": None
-        },
-        {
-            "id": "T3",
-            "name": "Tanker T3",
-            "imo_number": "IMO1000003",
-            "capacity_mt": 50000,
-            "charter_rate_display_cr_per_day": 0.51,
-            "daily_charter_rate": 5100000,
-            "grt": 25000,
-            "length_m": 200,
-            "beam_m": 32,
-            "draft_m": 12.0,
-            "speed_knots": 14.0,
-            "fuel_consumption_mt_per_day": 25.0,
-            "crew_size": 20,
-            "status": "available",
-            "current_port": None
-        },
-        {
-            "id": "T4",
-            "name": "Tanker T4",
-            "imo_number": "IMO1000004",
-            "capacity_mt": 50000,
-            "charter_rate_display_cr_per_day": 0.51,
-            "daily_charter_rate": 5100000,
-            "grt": 25000,
-            "length_m": 200,
-            "beam_m": 32,
-            "draft_m": 12.0,
-            "speed_knots": 14.0,
-            "fuel_consumption_mt_per_day": 25.0,
-            "crew_size": 20,
-            "status": "available",
-            "current_port": None
-        },
-        {
-            "id": "T5",
-            "name": "Tanker T5",
-            "imo_number": "IMO1000005",
-            "capacity_mt": 50000,
-            "charter_rate_display_cr_per_day": 0.53,
-            "daily_charter_rate": 5300000,
-            "grt": 25000,
-            "length_m": 200,
-            "beam_m": 32,
-            "draft_m": 12.0,
-            "speed_knots": 14.0,
-            "fuel_consumption_mt_per_day": 25.0,
-            "crew_size": 20,
-            "status": "available",
-            "current_port": None
-        },
-        {
-            "id": "T6",
-            "name": "Tanker T6",
-            "imo_number": "IMO1000006",
-            "capacity_mt": 50000,
-            "charter_rate_display_cr_per_day": 0.57,
-            "daily_charter_rate": 5700000,
-            "grt": 25000,
-            "length_m": 200,
-            "beam_m": 32,
-            "draft_m": 12.0,
-            "speed_knots": 14.0,
-            "fuel_consumption_mt_per_day": 25.0,
-            "crew_size": 20,
-            "status": "available",
-            "current_port": None
-        },
-        {
-            "id": "T7",
-            "name": "Tanker T7",
-            "imo_number": "IMO1000007",
-            "capacity_mt": 50000,
-            "charter_rate_display_cr_per_day": 0.65,
-            "daily_charter_rate": 6500000,
-            "grt": 25000,
-            "length_m": 200,
-            "beam_m": 32,
-            "draft_m": 12.0,
-            "speed_knots": 14.0,
-            "fuel_consumption_mt_per_day": 25.0,
-            "crew_size": 20,
-            "status": "available",
-            "current_port": None
-        },
-        {
-            "id": "T8",
-            "name": "Tanker T8",
-            "imo_number": "IMO1000008",
-            "capacity_mt": 25000,
-            "charter_rate_display_cr_per_day": 0.39,
-            "daily_charter_rate": 3900000,
-            "grt": 12500,
-            "length_m": 150,
-            "beam_m": 24,
-            "draft_m": 10.0,
-            "speed_knots": 13.0,
-            "fuel_consumption_mt_per_day": 15.0,
-            "crew_size": 18,
-            "status": "available",
-            "current_port": None
-        },
-        {
-            "id": "T9",
-            "name": "Tanker T9",
-            "imo_number": "IMO1000009",
-            "capacity_mt": 25000,
-            "charter_rate_display_cr_per_day": 0.38,
-            "daily_charter_rate": 3800000,
-            "grt": 12500,
-            "length_m": 150,
-            "beam_m": 24,
-            "draft_m": 10.0,
-            "speed_knots": 13.0,
-            "fuel_consumption_mt_per_day": 15.0,
-            "crew_size": 18,
-            "status": "available",
-            "current_port": None
-        }
+        _tanker("T1", "IMO1000001", _TANKER_50K, 0.63, 6300000),
+        _tanker("T2", "IMO1000002", _TANKER_50K, 0.49, 4900000),
+        _tanker("T3", "IMO1000003", _TANKER_50K, 0.51, 5100000),
+        _tanker("T4", "IMO1000004", _TANKER_50K, 0.51, 5100000),
+        _tanker("T5", "IMO1000005", _TANKER_50K, 0.53, 5300000),
+        _tanker("T6", "IMO1000006", _TANKER_50K, 0.57, 5700000),
+        _tanker("T7", "IMO1000007", _TANKER_50K, 0.65, 6500000),
+        _tanker("T8", "IMO1000008", _TANKER_25K, 0.39, 3900000),
+        _tanker("T9", "IMO1000009", _TANKER_25K, 0.38, 3800000),
     ]
 
 
+@lru_cache(maxsize=1)
 def get_challenge_loading_ports() -> List[Dict[str, Any]]:
     """6 Loading Ports (L1-L6) with unlimited supply"""
     return [
@@ -260,6 +177,7 @@ def get_challenge_loading_ports() -> List[Dict[str, Any]]:
     ]
 
 
+@lru_cache(maxsize=1)
 def get_challenge_unloading_ports() -> List[Dict[str, Any]]:
     """11 Unloading Ports (U1-U11) with monthly demand"""
     return [
@@ -277,6 +195,7 @@ def get_challenge_unloading_ports() -> List[Dict[str, Any]]:
     ]
 
 
+@lru_cache(maxsize=1)
 def get_challenge_trip_times_load_to_unload() -> Dict[str, Dict[str, float]]:
     """Trip times from Loading ports to Unloading ports (in days)"""
     return {
@@ -289,6 +208,7 @@ def get_challenge_trip_times_load_to_unload() -> Dict[str, Dict[str, float]]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_challenge_trip_times_unload_to_unload() -> Dict[str, Dict[str, float]]:
     """Trip times between Unloading ports (in days) - for multi-port discharge"""
     return {
@@ -306,24 +226,19 @@ def get_challenge_trip_times_unload_to_unload() -> Dict[str, Dict[str, float]]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_monthly_demands() -> List[Dict[str, Any]]:
-    """Monthly demand at all unloading ports (MT/month)"""
-    demands = [
-        {"port_id": "U1", "demand_mt": 40000},
-        {"port_id": "U2", "demand_mt": 135000},
-        {"port_id": "U3", "demand_mt": 5000},
-        {"port_id": "U4", "demand_mt": 20000},
-        {"port_id": "U5", "demand_mt": 20000},
-        {"port_id": "U6", "demand_mt": 20000},
-        {"port_id": "U7", "demand_mt": 110000},
-        {"port_id": "U8", "demand_mt": 30000},
-        {"port_id": "U9", "demand_mt": 20000},
-        {"port_id": "U10", "demand_mt": 20000},
-        {"port_id": "U11", "demand_mt": 20000}
+    """
+    Monthly demand at all unloading ports (MT/month). Derived from the
+    unloading port table, which is the single source of the demand figures.
+    """
+    return [
+        {"port_id": p["id"], "demand_mt": p["demand_mt"]}
+        for p in get_challenge_unloading_ports()
     ]
-    return demands
 
 
+@lru_cache(maxsize=1)
 def get_challenge_configuration() -> Dict[str, Any]:
     """Complete challenge configuration"""
     monthly_demands = get_monthly_demands()
@@ -341,10 +256,73 @@ def get_challenge_configuration() -> Dict[str, Any]:
         "unloading_ports_data": get_challenge_unloading_ports(),
         "trip_times_load_unload": get_challenge_trip_times_load_to_unload(),
         "trip_times_unload_unload": get_challenge_trip_times_unload_to_unload(),
-        "monthly_demands": get_monthly_demands()
+        "monthly_demands": monthly_demands
     }
 
 
+# ── Column (SoA) views ───────────────────────────────────────────────────────
+# The same PS tables as aligned NumPy columns, for fleet/port math done with one
+# ufunc pass instead of a Python loop over dicts. float64 like the trip matrices,
+# so costs derived from these columns round exactly as the scalar path does.
+# Arrays are shared by every caller and are marked read-only.
+
+def _columns(records: List[Dict[str, Any]], fields: tuple) -> Dict[str, np.ndarray]:
+    columns = {"ids": np.array([r["id"] for r in records])}
+    for field in fields:
+        columns[field] = np.array([r[field] for r in records], dtype=np.float64)
+    for array in columns.values():
+        array.setflags(write=False)
+    return columns
+
+
+@lru_cache(maxsize=1)
+def get_vessels_soa() -> Dict[str, np.ndarray]:
+    """Vessel columns aligned with "ids" (T1..T9)"""
+    return _columns(
+        get_challenge_vessels(),
+        (
+            "capacity_mt", "grt", "length_m", "beam_m", "draft_m",
+            "speed_knots", "fuel_consumption_mt_per_day", "daily_charter_rate"
+        )
+    )
+
+
+@lru_cache(maxsize=1)
+def get_loading_ports_soa() -> Dict[str, np.ndarray]:
+    """Loading port coordinates aligned with "ids" (L1..L6)"""
+    return _columns(get_challenge_loading_ports(), ("latitude", "longitude"))
+
+
+@lru_cache(maxsize=1)
+def get_unloading_ports_soa() -> Dict[str, np.ndarray]:
+    """Unloading port coordinates and demand aligned with "ids" (U1..U11)"""
+    return _columns(get_challenge_unloading_ports(), ("latitude", "longitude", "demand_mt"))
+
+
+@lru_cache(maxsize=1)
+def get_trip_time_matrices() -> Tuple[np.ndarray, np.ndarray, Dict[str, int], Dict[str, int]]:
+    """
+    Trip-time tables as dense day matrices: (L→U (6, 11), U→U (11, 11),
+    loading port id → row, unloading port id → row/column). Lookups are
+    integer indexing instead of two chained dict probes. Both tables are
+    complete (see validate_challenge_data), so every cell comes from the PS.
+    """
+    ltu = get_challenge_trip_times_load_to_unload()
+    utu = get_challenge_trip_times_unload_to_unload()
+    load_index = {port_id: i for i, port_id in enumerate(ltu)}
+    unload_index = {port_id: i for i, port_id in enumerate(utu)}
+    
+    load_to_unload = np.array(
+        [[ltu[l][u] for u in unload_index] for l in load_index], dtype=np.float64
+    )
+    unload_to_unload = np.array(
+        [[utu[u1][u2] for u2 in unload_index] for u1 in unload_index], dtype=np.float64
+    )
+    load_to_unload.setflags(write=False)
+    unload_to_unload.setflags(write=False)
+    return load_to_unload, unload_to_unload, load_index, unload_index
+
+
 def validate_challenge_data() -> None:
     """
     mn2 fix: Assert structural correctness of all PS tables at import time.
@@ -8,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from contextlib import asynccontextmanager
 from typing import List, Dict, Any
 
@@ -18,12 +20,23 @@ from .models.database import (
     HPCLVesselDB, HPCLPortDB, _in_memory_data
 )
 from .core.config import get_settings
+from .core.responses import HPCLORJSONResponse
 from .data.sample_data import generate_hpcl_sample_data
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# While the app runs, log records go through a queue so formatting and stream
+# I/O (including logger.exception tracebacks) run on a background thread, not
+# the event loop. The queue handler is installed and removed with the app
+# lifespan, so code that imports this module without running the app (scripts,
+# OpenAPI export) keeps logging directly.
+_root_logger = logging.getLogger()
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_queue_handler = QueueHandler(_log_queue)
+log_listener = QueueListener(_log_queue, respect_handler_level=True)
+
 settings = get_settings()
 
 
@@ -45,15 +58,16 @@ async def seed_initial_data():
             logger.info(f"Data already exists: {len(existing_vessels)} vessels, {len(existing_ports)} ports")
             return
         
-        # Seed vessels
+        # Seed vessels (the sample records are shared and read-only; the DB
+        # layer annotates what it stores, so each gets its own copy)
         logger.info(f"Seeding {len(sample_data['vessels'])} vessels...")
         for vessel in sample_data['vessels']:
-            await HPCLVesselDB.create_vessel(vessel)
+            await HPCLVesselDB.create_vessel(dict(vessel))
         
         # Seed ports
         logger.info(f"Seeding {len(sample_data['ports'])} ports...")
         for port in sample_data['ports']:
-            await HPCLPortDB.create_port(port)
+            await HPCLPortDB.create_port(dict(port))
         
         logger.info("✅ Initial data seeding completed successfully")
         
@@ -68,6 +82,10 @@ async def lifespan(app: FastAPI):
     Application lifespan events
     """
     # Startup
+    direct_log_handlers = _root_logger.handlers
+    log_listener.handlers = tuple(direct_log_handlers)
+    _root_logger.handlers = [_log_queue_handler]
+    log_listener.start()
     logger.info("Starting HPCL Coastal Tanker Optimization API...")
     
     # Initialize database connection
@@ -87,6 +105,8 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down HPCL API...")
     await close_mongo_connection()
     logger.info("HPCL API shutdown complete")
+    log_listener.stop()
+    _root_logger.handlers = direct_log_handlers
 
 
 # Create FastAPI application
@@ -137,7 +157,9 @@ app = FastAPI(
         "name": "MIT License",
         "url": "https://opensource.org/licenses/MIT"
     },
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson for every route without its own response_class (routers inherit it)
+    default_response_class=HPCLORJSONResponse
 )
 
 # Configure CORS for frontend integration
@@ -4,14 +4,22 @@ MongoDB document models for HPCL-specific data
 """
 
 from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+import asyncio
+import logging
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
 
 # MongoDB Configuration
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 DATABASE_NAME = "hpcl_coastal_optimizer"
 
+# Connection pool ceiling: (cores * 2) + 1, so request bursts queue inside the
+# driver instead of opening connections until the server refuses them
+MONGODB_MAX_POOL_SIZE = (os.cpu_count() or 1) * 2 + 1
+
 
 class MongoDB:
     """HPCL MongoDB Connection Manager"""
@@ -30,7 +38,10 @@ async def connect_to_mongo():
         db.client = AsyncIOMotorClient(
             MONGODB_URL,
             serverSelectionTimeoutMS=5000,  # 5 second timeout
-            connectTimeoutMS=5000
+            connectTimeoutMS=5000,
+            maxPoolSize=MONGODB_MAX_POOL_SIZE,
+            minPoolSize=2,
+            maxIdleTimeMS=600000  # recycle connections idle for 10 minutes
         )
         db.database = db.client[DATABASE_NAME]
         
@@ -76,6 +87,7 @@ async def create_indexes():
     # Optimization results indexes
     await db.database.optimization_results.create_index("request_id", unique=True)
     await db.database.optimization_results.create_index("month")
+    await db.database.optimization_results.create_index("request_hash")
     await db.database.optimization_results.create_index("created_at")
     
     # Tasks collection indexes
@@ -146,6 +158,12 @@ class HPCLVesselDB:
             # In-memory fallback
             return [v for v in _in_memory_data["vessels"] if v.get("status") == "available"][:9]
     
+    @staticmethod
+    async def get_all_vessels_with_availability() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Get all HPCL vessels and the available subset from a single query"""
+        vessels = await HPCLVesselDB.get_all_vessels()
+        return vessels, [v for v in vessels if v.get("status") == "available"]
+    
     @staticmethod
     async def update_vessel_status(vessel_id: str, status: str, current_port: str = None):
         """Update HPCL vessel status"""
@@ -216,6 +234,19 @@ class HPCLPortDB:
             # In-memory fallback
             return [p for p in _in_memory_data["ports"] if p.get("type") == "unloading"][:11]
     
+    @staticmethod
+    async def get_loading_and_unloading_ports() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Get HPCL loading (max 6) and unloading (max 11) ports from a single query"""
+        if db.database:
+            cursor = db.database.ports.find({"type": {"$in": ["loading", "unloading"]}})
+            ports = await cursor.to_list(length=None)
+        else:
+            # In-memory fallback
+            ports = _in_memory_data["ports"]
+        loading = [p for p in ports if p.get("type") == "loading"][:6]
+        unloading = [p for p in ports if p.get("type") == "unloading"][:11]
+        return loading, unloading
+    
     @staticmethod
     async def get_all_ports() -> List[Dict[str, Any]]:
         """Get all HPCL ports (17 total)"""
@@ -293,7 +324,9 @@ class OptimizationResultDB:
     @staticmethod
     async def save_result(result_data: Dict[str, Any]) -> str:
         """Save HPCL optimization result"""
-        result_data["created_at"] = datetime.now()
+        # Shallow copy: callers reuse result_data (task result, Celery return value),
+        # which must not pick up created_at or Mongo's _id
+        result_data = {**result_data, "created_at": datetime.now()}
         if db.database:
             result = await db.database.optimization_results.insert_one(result_data)
             return str(result.inserted_id)
@@ -324,6 +357,62 @@ class OptimizationResultDB:
             # In-memory fallback
             return [r for r in _in_memory_data["optimization_results"] if r.get("month") == month]
     
+    @staticmethod
+    async def get_latest_solved_result_for_month(month: str) -> Optional[Dict[str, Any]]:
+        """Most recent optimal/feasible result for a month (selected_routes only), for warm starts"""
+        query = {"month": month, "optimization_status": {"$in": ["optimal", "feasible"]}}
+        if db.database:
+            return await db.database.optimization_results.find_one(
+                query, {"selected_routes": 1}, sort=[("created_at", -1)]
+            )
+        else:
+            # In-memory fallback
+            solved = [
+                r for r in _in_memory_data["optimization_results"]
+                if r.get("month") == month and r.get("optimization_status") in ("optimal", "feasible")
+            ]
+            return max(solved, key=lambda r: r.get("created_at", datetime.min), default=None)
+    
+    @staticmethod
+    async def get_recent_result_by_hash(request_hash: str, max_age: timedelta) -> Optional[Dict[str, Any]]:
+        """Newest optimal/feasible result solved for an identical request within max_age"""
+        query = {
+            "request_hash": request_hash,
+            "optimization_status": {"$in": ["optimal", "feasible"]},
+            "created_at": {"$gte": datetime.now() - max_age}
+        }
+        if db.database:
+            return await db.database.optimization_results.find_one(
+                query, {"request_id": 1}, sort=[("created_at", -1)]
+            )
+        else:
+            # In-memory fallback
+            cutoff = query["created_at"]["$gte"]
+            matches = [
+                r for r in _in_memory_data["optimization_results"]
+                if r.get("request_hash") == request_hash
+                and r.get("optimization_status") in ("optimal", "feasible")
+                and r.get("created_at", datetime.min) >= cutoff
+            ]
+            return max(matches, key=lambda r: r["created_at"], default=None)
+    
+    @staticmethod
+    async def get_total_cost_for_month(month: str) -> Tuple[float, int]:
+        """Sum total_cost over a month's results as (total, count), reduced in the database"""
+        if db.database:
+            cursor = db.database.optimization_results.aggregate([
+                {"$match": {"month": month}},
+                {"$group": {"_id": None, "total": {"$sum": "$total_cost"}, "count": {"$sum": 1}}}
+            ])
+            groups = await cursor.to_list(length=1)
+            if not groups:
+                return 0.0, 0
+            return groups[0]["total"], groups[0]["count"]
+        else:
+            # In-memory fallback
+            results = [r for r in _in_memory_data["optimization_results"] if r.get("month") == month]
+            return sum(r.get("total_cost", 0) for r in results), len(results)
+    
     @staticmethod
     async def get_latest_results(limit: int = 10) -> List[Dict[str, Any]]:
         """Get latest HPCL optimization results"""
@@ -362,13 +451,21 @@ class TaskDB:
             return _in_memory_data["tasks"].get(task_id)
     
     @staticmethod
-    async def update_task_status(task_id: str, status: str, progress: int = None, message: str = None):
+    async def update_task_status(
+        task_id: str,
+        status: str,
+        progress: int = None,
+        message: str = None,
+        metadata: Dict[str, Any] = None
+    ):
         """Update task status and progress"""
         update_data = {"status": status, "last_updated": datetime.now()}
         if progress is not None:
             update_data["progress"] = progress
         if message is not None:
             update_data["message"] = message
+        if metadata is not None:
+            update_data["metadata"] = metadata
         
         if db.database:
             return await db.database.tasks.update_one(
@@ -396,6 +493,64 @@ class TaskDB:
             return type('obj', (object,), {'modified_count': 1})()
 
 
+class TaskProgressBuffer:
+    """
+    Write-coalescing progress reporter for one task.
+
+    set() only records the latest (status, progress, message) and schedules a
+    flush; at most one TaskDB write happens per flush interval, carrying
+    whatever is newest by then. finish() writes the terminal state immediately.
+    """
+    
+    def __init__(self, task_id: str, flush_interval: float = 0.5):
+        self.task_id = task_id
+        self.flush_interval = flush_interval
+        self._pending: Optional[Tuple[str, int, str]] = None
+        self._flusher: Optional[asyncio.Task] = None
+        # True once a flush has woken up and issued its write
+        self._flushing = False
+    
+    def set(self, status: str, progress: int, message: str) -> None:
+        self._pending = (status, progress, message)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_later())
+    
+    async def finish(self, status: str, progress: int, message: str):
+        """Settle any scheduled flush, then write the final state"""
+        flusher = self._flusher
+        if flusher is not None:
+            # A flush still sleeping is cancelled before it can write. One that
+            # is already writing is awaited instead: cancelling would not stop
+            # an update already sent, which could then land after the terminal
+            # write and leave the task looking stuck.
+            if not self._flushing:
+                flusher.cancel()
+            try:
+                # shield(): a cancellation of finish() itself must not be
+                # mistaken for the flusher's own
+                await asyncio.shield(flusher)
+            except asyncio.CancelledError:
+                if not flusher.cancelled():
+                    raise
+            except Exception:
+                logger.warning("Progress update for task %s failed", self.task_id, exc_info=True)
+        self._pending = (status, progress, message)
+        return await self._write()
+    
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        self._flushing = True
+        try:
+            await self._write()
+        finally:
+            self._flushing = False
+    
+    async def _write(self):
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            return await TaskDB.update_task_status(self.task_id, *pending)
+
+
 class DistanceMatrixDB:
     """Distance Matrix Database Operations"""
     
@@ -219,16 +219,24 @@ class HPCLRoute(BaseModel):
 class OptimizationRequest(BaseModel):
     """HPCL Fleet Optimization Request"""
     month: str = Field(..., description="Optimization month (e.g., '2025-11')")
-    demands: List[MonthlyDemand] = Field(..., description="Monthly demands at all unloading ports")
+    # HPCL limits are Field constraints, enforced by pydantic-core while parsing
+    demands: List[MonthlyDemand] = Field(
+        ...,
+        max_length=HPCL_UNLOADING_PORTS,
+        description="Monthly demands at all unloading ports"
+    )
     
     # Fleet Constraints
     available_vessels: List[str] = Field(
         default_factory=list,
+        max_length=HPCL_FLEET_SIZE,
         description="Available vessel IDs (default: all 9 vessels)"
     )
     fuel_price_per_mt: float = Field(
         default=45000.0,
-        description="Bunker fuel price (₹/MT)"
+        ge=20000,
+        le=80000,
+        description="Bunker fuel price (₹/MT, reasonable range ₹20,000 - ₹80,000)"
     )
     
     # Optimization Parameters
@@ -240,13 +248,6 @@ class OptimizationRequest(BaseModel):
         default=300,
         description="Maximum solver time (5 minutes default)"
     )
-    
-    @validator('demands')
-    def validate_demands_ports(cls, v):
-        """Ensure demands are only for HPCL unloading ports"""
-        if len(v) > HPCL_UNLOADING_PORTS:
-            raise ValueError(f'Cannot exceed {HPCL_UNLOADING_PORTS} unloading ports')
-        return v
 
 
 class VoyageActivity(BaseModel):
@@ -392,3 +393,38 @@ class OptimizationRequestResponse(BaseModel):
     status: str = "submitted"
     estimated_completion_time: str
     message: str = "Optimization request submitted successfully"
+
+
+# Unvalidated construction for data that was validated when written (stored
+# documents, the PS tables). Enums and int-valued floats are still coerced so
+# the models serialize exactly like validated ones.
+
+def _float_fields(model) -> frozenset:
+    return frozenset(
+        name for name, field in model.model_fields.items()
+        if field.annotation in (float, Optional[float])
+    )
+
+
+_VESSEL_FLOAT_FIELDS = _float_fields(HPCLVessel)
+_PORT_FLOAT_FIELDS = _float_fields(HPCLPort)
+
+
+def construct_vessel(data: Dict[str, Any]) -> HPCLVessel:
+    """HPCLVessel via model_construct, with the status enum and floats coerced"""
+    fields = {
+        k: float(v) if k in _VESSEL_FLOAT_FIELDS and isinstance(v, int) else v
+        for k, v in data.items()
+    }
+    fields["status"] = VesselStatus(data.get("status", VesselStatus.AVAILABLE))
+    return HPCLVessel.model_construct(**fields)
+
+
+def construct_port(data: Dict[str, Any]) -> HPCLPort:
+    """HPCLPort via model_construct, with the type enum and floats coerced"""
+    fields = {
+        k: float(v) if k in _PORT_FLOAT_FIELDS and isinstance(v, int) else v
+        for k, v in data.items()
+    }
+    fields["type"] = PortType(data["type"])
+    return HPCLPort.model_construct(**fields)
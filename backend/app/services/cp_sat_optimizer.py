@@ -4,15 +4,19 @@ OR-Tools CP-SAT solver for HPCL's Set Partitioning Problem
 """
 
 from ortools.sat.python import cp_model
+import numpy as np
+import asyncio
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 import math
 import time
+from operator import itemgetter
 import logging
 import json
 from datetime import datetime, timedelta
 
 from ..models.schemas import HPCLVessel, HPCLPort, HPCLRoute, MonthlyDemand, OptimizationResult, VesselSchedule, VoyageActivity, ActivityType
-from .route_generator import HPCLRouteOptimizer, TRIP_TIMES_LOAD_TO_UNLOAD, TRIP_TIMES_UNLOAD_TO_UNLOAD
+from .route_generator import HPCLRouteOptimizer, TRIP_LU_FLAT, TRIP_UU_FLAT
 from .infeasibility_analyzer import analyze_infeasibility
 from ..core.config import get_settings
 
@@ -21,6 +25,105 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def max_trips_per_vessel(min_trip_hours: float, available_hours: float = 720.0) -> int:
+    """Upper bound on voyages one vessel can complete in the monthly time budget"""
+    return math.floor(available_hours / max(min_trip_hours, 0.01))
+
+
+def infeasibility_recommendations(
+    total_demand: float,
+    total_capacity: float,
+    demand_dict: Dict[str, float]
+) -> List[str]:
+    """
+    Human-readable explanation for a demand that exceeds the fleet's deliverable volume
+    """
+    capacity_gap = total_demand - total_capacity
+    return [
+        f"⚠️ INFEASIBLE: Total demand ({total_demand:,.0f} MT) cannot be met within the monthly time budget.",
+        f"Fleet can deliver at most {total_capacity:,.0f} MT given the 720-hour/month constraint and PS trip times.",
+        f"Shortfall: {capacity_gap:,.0f} MT",
+        f"Suggested solutions:",
+        f"  1. Charter additional vessel(s) — minimum additional capacity needed: {capacity_gap:,.0f} MT over the month",
+        f"  2. The 720 h/month time budget (not a voyage count) is the binding constraint — shorter routes help",
+        f"  3. Multi-loading port operations are already restricted to single loading port per voyage (PS constraint)",
+        f"  4. Reduce demand at highest-demand ports: " + ", ".join(
+            f"{port_id} ({demand:,.0f} MT)" 
+            for port_id, demand in sorted(demand_dict.items(), key=itemgetter(1), reverse=True)[:3]
+        )
+    ]
+
+
+def route_hint_key(vessel_id: str, loading_port: str, discharge_ports: List[str]) -> str:
+    """Stable identity of a voyage pattern, used to carry solutions across solves"""
+    return f"{vessel_id}:{loading_port}:{'+'.join(discharge_ports)}"
+
+
+def warm_start_hints_from_result(result: OptimizationResult) -> Dict[str, int]:
+    """Route execution counts of a solved result, keyed for warm_start_hints"""
+    hints: Dict[str, int] = {}
+    for route in result.selected_routes:
+        key = route_hint_key(route.vessel_id, route.loading_port, route.discharge_ports)
+        hints[key] = hints.get(key, 0) + (route.execution_count or 0)
+    return hints
+
+
+def warm_start_hints_from_document(result_data: Dict[str, Any]) -> Dict[str, int]:
+    """warm_start_hints_from_result for a stored result document (plain dicts)"""
+    hints: Dict[str, int] = {}
+    for route in result_data.get("selected_routes", []):
+        key = route_hint_key(route["vessel_id"], route["loading_port"], route["discharge_ports"])
+        hints[key] = hints.get(key, 0) + (route.get("execution_count") or 0)
+    return hints
+
+
+def greedy_warm_start_hints(
+    feasible_routes: List[Dict[str, Any]],
+    demand_dict: Dict[str, float],
+    vessels: List[HPCLVessel]
+) -> Dict[str, int]:
+    """
+    Cheap feasible-ish starting point for CP-SAT when no previous solution exists.
+
+    Largest demand first, each port is filled with full-capacity direct trips on
+    the cheapest route (cost per MT) whose tanker still has hours left in its
+    monthly budget. Only the route counts are produced; CP-SAT repairs whatever
+    the greedy pass gets wrong.
+    """
+    hours_left = {v.id: v.monthly_available_hours for v in vessels}
+    direct_routes: Dict[str, List[Tuple[float, Dict[str, Any]]]] = {}
+    for route in feasible_routes:
+        if len(route['discharge_ports']) != 1:
+            continue
+        capacity = route.get('vessel_capacity_mt', 50000) or 1
+        direct_routes.setdefault(route['discharge_ports'][0], []).append(
+            (route['total_cost'] / capacity, route)
+        )
+    for candidates in direct_routes.values():
+        candidates.sort(key=itemgetter(0))
+
+    hints: Dict[str, int] = {}
+    for port_id, demand in sorted(demand_dict.items(), key=itemgetter(1), reverse=True):
+        remaining = demand
+        for _, route in direct_routes.get(port_id, ()):
+            if remaining <= 0:
+                break
+            vessel_id = route['vessel_id']
+            trip_hours = route['total_time_hours']
+            capacity = route.get('vessel_capacity_mt', 50000)
+            trips = min(
+                math.ceil(remaining / max(capacity, 1)),
+                int(hours_left.get(vessel_id, 0) // max(trip_hours, 0.01))
+            )
+            if trips <= 0:
+                continue
+            key = route_hint_key(vessel_id, route['loading_port'], route['discharge_ports'])
+            hints[key] = hints.get(key, 0) + trips
+            hours_left[vessel_id] -= trips * trip_hours
+            remaining -= trips * capacity
+    return hints
+
+
 class HPCLCPSATOptimizer:
     """
     HPCL CP-SAT Optimization Engine
@@ -36,6 +139,8 @@ class HPCLCPSATOptimizer:
         self.constraints = {}
         self.solver_profile = solver_profile
         self.settings = get_settings()
+        # Model, solver and variable maps are instance state — one solve at a time
+        self._solve_lock = threading.Lock()
         self.metrics = {
             "route_generation_time": 0,
             "model_setup_time": 0,
@@ -55,11 +160,19 @@ class HPCLCPSATOptimizer:
         fuel_price_per_mt: float = 45000.0,
         optimization_objective: str = "cost",
         max_solve_time_seconds: Optional[int] = None,
-        num_workers: Optional[int] = None
+        num_workers: Optional[int] = None,
+        warm_start_hints: Optional[Dict[str, int]] = None
     ) -> OptimizationResult:
         """
         Main optimization function for HPCL fleet
         With configurable solver parameters and comprehensive logging
+
+        Route generation (which may await the distance-matrix store) runs on
+        the caller's event loop; only the synchronous model build, Solve() and
+        result extraction move to a worker thread, so the caller's loop stays
+        responsive while CP-SAT blocks. Safe to call concurrently on a shared
+        instance: solves are serialized, while the route cache is reused
+        across calls.
         """
         total_start = time.time()
         logger.info(f"Starting HPCL CP-SAT fleet optimization (profile={self.solver_profile})...")
@@ -98,8 +211,72 @@ class HPCLCPSATOptimizer:
                 fuel_price_per_mt=fuel_price_per_mt,
                 optimization_focus=optimization_objective
             )
-            
-            self.metrics["route_generation_time"] = time.time() - route_gen_start
+            route_generation_time = time.time() - route_gen_start
+        except Exception as e:
+            logger.error(json.dumps({
+                "event": "optimization_error",
+                "error": str(e),
+                "error_type": type(e).__name__
+            }))
+            return self._create_error_result(str(e), total_start)
+        
+        # Steps 2-7 are CPU-bound and touch no event-loop resources
+        return await asyncio.to_thread(
+            self._solve_routes,
+            feasible_routes, route_generation_time, vessels, unloading_ports,
+            monthly_demands, optimization_objective, solve_time, workers,
+            warm_start_hints, total_start
+        )
+
+    def _solve_routes(
+        self,
+        feasible_routes: List[Dict[str, Any]],
+        route_generation_time: float,
+        vessels: List[HPCLVessel],
+        unloading_ports: List[HPCLPort],
+        monthly_demands: List[MonthlyDemand],
+        optimization_objective: str,
+        solve_time: float,
+        workers: int,
+        warm_start_hints: Optional[Dict[str, int]],
+        total_start: float
+    ) -> OptimizationResult:
+        """
+        Build and solve the CP-SAT model over generated routes (blocking).
+        Model, solver and variable maps are instance state, so this holds the
+        solve lock throughout.
+        """
+        with self._solve_lock:
+            return self._solve_routes_locked(
+                feasible_routes, route_generation_time, vessels, unloading_ports,
+                monthly_demands, optimization_objective, solve_time, workers,
+                warm_start_hints, total_start
+            )
+
+    def _solve_routes_locked(
+        self,
+        feasible_routes: List[Dict[str, Any]],
+        route_generation_time: float,
+        vessels: List[HPCLVessel],
+        unloading_ports: List[HPCLPort],
+        monthly_demands: List[MonthlyDemand],
+        optimization_objective: str,
+        solve_time: float,
+        workers: int,
+        warm_start_hints: Optional[Dict[str, int]],
+        total_start: float
+    ) -> OptimizationResult:
+        """
+        Body of _solve_routes, run while holding the solve lock
+        """
+        # Demand/capacity aggregates, computed once and reused by the pre-solve
+        # check, the model bounds and the infeasibility report.
+        demand_dict = {d.port_id: d.demand_mt for d in monthly_demands}
+        total_demand_mt = sum(d.demand_mt for d in monthly_demands)
+        fleet_capacity_mt = sum(v.capacity_mt for v in vessels)
+        
+        try:
+            self.metrics["route_generation_time"] = route_generation_time
             self.metrics["num_routes"] = len(feasible_routes)
             
             if not feasible_routes:
@@ -110,18 +287,16 @@ class HPCLCPSATOptimizer:
             # ── Pre-solve feasibility check ─────────────────────────────────────
             # Compute the theoretical maximum deliverable volume given the 720h budget.
             # If this is less than total demand, the problem is structurally infeasible.
-            total_system_demand_val = sum(d.demand_mt for d in monthly_demands)
-            demand_dict_pre = {d.port_id: d.demand_mt for d in monthly_demands}
             min_trip_hours = min(r['total_time_hours'] for r in feasible_routes)
-            max_trips_any_vessel = math.floor(720.0 / max(min_trip_hours, 0.01))
-            max_deliverable = sum(v.capacity_mt * max_trips_any_vessel for v in vessels)
-            if max_deliverable < total_system_demand_val:
+            max_trips_any_vessel = max_trips_per_vessel(min_trip_hours)
+            max_deliverable = fleet_capacity_mt * max_trips_any_vessel
+            if max_deliverable < total_demand_mt:
                 logger.warning(
                     f"Pre-solve infeasibility: max_deliverable={max_deliverable} MT "
-                    f"< total_demand={total_system_demand_val} MT — skipping solver"
+                    f"< total_demand={total_demand_mt} MT — skipping solver"
                 )
                 return self._create_infeasibility_result(
-                    total_system_demand_val, max_deliverable, demand_dict_pre, vessels, total_start
+                    total_demand_mt, max_deliverable, demand_dict, vessels, total_start
                 )
             # ───────────────────────────────────────────────────────────────────
 
@@ -130,12 +305,11 @@ class HPCLCPSATOptimizer:
             self._initialize_cp_model()
 
             # Step 3: Create decision variables
-            total_system_demand = int(sum(d.demand_mt for d in monthly_demands))
+            total_system_demand = int(total_demand_mt)
             self._create_decision_variables(feasible_routes, total_system_demand)
             self.metrics["num_variables"] = len(self.decision_variables)
             
             # Step 4: Add constraints
-            demand_dict = {demand.port_id: demand.demand_mt for demand in monthly_demands}
             self._add_demand_constraints(feasible_routes, demand_dict, unloading_ports)
             self._add_vessel_time_constraints(feasible_routes, vessels)
             self._add_hpcl_operational_constraints(feasible_routes, vessels)
@@ -163,6 +337,13 @@ class HPCLCPSATOptimizer:
             self.solver.parameters.num_search_workers = workers
             self.solver.parameters.log_search_progress = self.settings.solver_log_progress
             
+            # Warm start from a previous solution if the caller has one,
+            # otherwise (if enabled) from greedy cheapest-direct-trip counts
+            if not warm_start_hints and self.settings.solver_greedy_warm_start:
+                warm_start_hints = greedy_warm_start_hints(feasible_routes, demand_dict, vessels)
+            if warm_start_hints:
+                self._add_warm_start_hints(feasible_routes, warm_start_hints)
+            
             # Solve
             status = self.solver.Solve(self.model)
             self.metrics["solve_time"] = time.time() - solve_start
@@ -180,21 +361,17 @@ class HPCLCPSATOptimizer:
             
             # Step 7: Process results
             if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-                result = await self._extract_optimization_result(
+                result = self._extract_optimization_result(
                     status, feasible_routes, vessels, unloading_ports, 
                     demand_dict, self.metrics["solve_time"], optimization_objective
                 )
             elif status == cp_model.INFEASIBLE:
                 # Problem is infeasible - demands cannot be met
-                total_demand = sum(demand_dict.values())
                 # Use actual minimum trip time from generated routes for accuracy
-                min_trip_hours_actual = min(
-                    r['total_time_hours'] for r in feasible_routes
-                ) if feasible_routes else (0.3 * 24.0)
-                max_trips_per_vessel = int(720.0 / max(min_trip_hours_actual, 0.01))
-                total_capacity = sum(v.capacity_mt * max_trips_per_vessel for v in vessels)
+                # (min_trip_hours from the pre-solve check; feasible_routes is non-empty here)
+                total_capacity = fleet_capacity_mt * max_trips_per_vessel(min_trip_hours)
                 result = self._create_infeasibility_result(
-                    total_demand, total_capacity, demand_dict, vessels, total_start
+                    total_demand_mt, total_capacity, demand_dict, vessels, total_start
                 )
             else:
                 result = self._create_error_result(
@@ -315,6 +492,34 @@ class HPCLCPSATOptimizer:
             f"and per-port cargo variables"
         )
     
+    def _add_warm_start_hints(self, feasible_routes: List[Dict[str, Any]], hints: Dict[str, int]):
+        """
+        Hint every route_count variable from a previous solution.
+
+        Route ids carry a random suffix, so hints are matched on
+        route_hint_key(). Routes absent from the hint are hinted to 0, so all
+        route counts are hinted; the per-port cargo and other auxiliary
+        variables are not, and CP-SAT derives them during search. Nothing is
+        hinted if no route matches (different fleet or port set).
+        """
+        remaining = dict(hints)
+        matched = 0
+        hinted = []
+        for route in feasible_routes:
+            key = route_hint_key(route['vessel_id'], route['loading_port'], route['discharge_ports'])
+            value = remaining.pop(key, 0)
+            if value:
+                matched += 1
+            hinted.append((self.route_count_vars[route['route_id']], value))
+        
+        if not matched:
+            logger.info("Warm-start hints did not match any generated route; solving cold")
+            return
+        
+        for var, value in hinted:
+            self.model.AddHint(var, value)
+        logger.info(f"Warm-started CP-SAT with {matched} hinted routes")
+    
     def _add_demand_constraints(
         self,
         feasible_routes: List[Dict[str, Any]],
@@ -342,6 +547,23 @@ class HPCLCPSATOptimizer:
         ports_with_routes = 0
         ports_without_routes = 0
 
+        # Index cargo variables and direct/split route counts by port in a single
+        # pass over the routes, instead of rescanning every route for every port.
+        port_cargo_vars: Dict[str, List[Any]] = {}
+        port_route_counts: Dict[str, List[int]] = {}  # port_id -> [direct, split]
+        for route in feasible_routes:
+            route_cargo_vars = self.cargo_to_vars[route['route_id']]
+            discharge_ports = route['discharge_ports']
+            for port_id in discharge_ports:
+                cargo_var = route_cargo_vars.get(port_id)
+                if cargo_var is not None:
+                    port_cargo_vars.setdefault(port_id, []).append(cargo_var)
+                counts = port_route_counts.setdefault(port_id, [0, 0])
+                if len(discharge_ports) == 1:
+                    counts[0] += 1
+                elif len(discharge_ports) == 2:
+                    counts[1] += 1
+
         for port in unloading_ports:
             port_id = port.id
             demand_mt = int(round(demand_dict.get(port_id, 0.0)))
@@ -349,13 +571,8 @@ class HPCLCPSATOptimizer:
             if demand_mt == 0:
                 continue
 
-            # Collect all cargo variables that deliver to this port
-            serving_cargo_vars = []
-            for route in feasible_routes:
-                if port_id in route['discharge_ports']:
-                    cargo_var = self.cargo_to_vars[route['route_id']].get(port_id)
-                    if cargo_var is not None:
-                        serving_cargo_vars.append(cargo_var)
+            # All cargo variables that deliver to this port
+            serving_cargo_vars = port_cargo_vars.get(port_id, [])
 
             if not serving_cargo_vars:
                 logger.warning(f"Port {port_id}: no routes found — problem will be infeasible!")
@@ -380,8 +597,7 @@ class HPCLCPSATOptimizer:
 
         # Log constraint details
         for port_id, demand_mt in demand_dict.items():
-            direct_count = sum(1 for r in feasible_routes if port_id in r['discharge_ports'] and len(r['discharge_ports']) == 1)
-            split_count  = sum(1 for r in feasible_routes if port_id in r['discharge_ports'] and len(r['discharge_ports']) == 2)
+            direct_count, split_count = port_route_counts.get(port_id, (0, 0))
             logger.info(f"  Port {port_id}: demand={demand_mt} MT, direct_routes={direct_count}, split_routes={split_count}")
     
     def _add_vessel_time_constraints(
@@ -514,7 +730,7 @@ class HPCLCPSATOptimizer:
         
         logger.info(f"Objective set with {len(objective_terms)} cost/time terms (hard demand constraints, no penalties)")
     
-    async def _extract_optimization_result(
+    def _extract_optimization_result(
         self,
         status,
         feasible_routes: List[Dict[str, Any]],
@@ -591,31 +807,36 @@ class HPCLCPSATOptimizer:
 
         selected_routes = list(pattern_map.values())
 
-        for route_copy in selected_routes:
-            total_cost += route_copy['scaled_cost']
-            total_distance += route_copy['scaled_distance']
-            total_cargo += route_copy['scaled_cargo']
-
-        # Calculate demand satisfaction using actual per-port solver values
-        demands_met = {}
-        unmet_demand = {}
-
-        for port in unloading_ports:
-            port_id = port.id
-            original_demand = demand_dict.get(port_id, 0.0)
+        # Calculate demand satisfaction using actual per-port solver values.
+        # Per-port demand/delivery live in index-aligned arrays; the dicts the
+        # result model needs are rebuilt once at the end.
+        port_ids = list(dict.fromkeys(port.id for port in unloading_ports))
+        port_index = {port_id: i for i, port_id in enumerate(port_ids)}
+        demand_arr = np.fromiter(
+            (demand_dict.get(port_id, 0.0) for port_id in port_ids),
+            dtype=np.float64, count=len(port_ids)
+        )
+        delivered_arr = np.zeros(len(port_ids), dtype=np.float64)
 
-            delivered = 0.0
-            for route in selected_routes:
-                if port_id in route['discharge_ports']:
-                    # Use the actual cargo allocation from solver (no 50/50 assumption)
-                    delivered += route['cargo_per_port'].get(port_id, 0)
+        # Single pass over the selected routes: fleet totals plus the actual
+        # cargo allocation from solver per port (no 50/50 assumption).
+        for route in selected_routes:
+            total_cost += route['scaled_cost']
+            total_distance += route['scaled_distance']
+            total_cargo += route['scaled_cargo']
+            cargo_per_port = route['cargo_per_port']
+            for port_id in route['discharge_ports']:
+                i = port_index.get(port_id)
+                if i is not None:
+                    delivered_arr[i] += cargo_per_port.get(port_id, 0)
 
-            demands_met[port_id] = delivered
-            unmet_demand[port_id] = max(0, original_demand - delivered)
+        unmet_arr = np.maximum(demand_arr - delivered_arr, 0.0)
+        demands_met = dict(zip(port_ids, delivered_arr.tolist()))
+        unmet_demand = dict(zip(port_ids, unmet_arr.tolist()))
         
         total_demand = sum(demand_dict.values())
-        total_met = sum(demands_met.values())
-        total_unmet = sum(unmet_demand.values())
+        total_met = float(delivered_arr.sum())
+        total_unmet = float(unmet_arr.sum())
         surplus_mt = max(0.0, total_met - total_demand)
         # Satisfaction rate: based on unmet demand, capped at 100%.
         # With full-capacity loading + >= constraints, total_met may exceed total_demand;
@@ -635,7 +856,7 @@ class HPCLCPSATOptimizer:
             logger.info(f"  Port {port_id}: demand={demand} MT, delivered={delivered} MT, unmet={unmet} MT")
         
         # Generate vessel schedules
-        vessel_schedules = await self._generate_vessel_schedules(selected_routes, vessels)
+        vessel_schedules = self._generate_vessel_schedules(selected_routes, vessels)
         
         # Calculate fleet utilization
         fleet_utilization = self._calculate_fleet_utilization(vessel_schedules, vessels)
@@ -656,8 +877,8 @@ class HPCLCPSATOptimizer:
         current_month = datetime.now().strftime("%Y-%m")  # Dynamic month
 
         # Populate cost_breakdown: PS defines cost = charter_rate × trip_days only.
-        # Aggregate across all selected (aggregated) routes.
-        total_charter_cost = sum(r['scaled_cost'] for r in selected_routes)
+        # Already aggregated across all selected routes as total_cost above.
+        total_charter_cost = total_cost
         result_cost_breakdown = {
             "charter_cost": round(total_charter_cost, 2),
             "fuel_cost": 0.0,       # not part of PS cost model
@@ -703,7 +924,7 @@ class HPCLCPSATOptimizer:
             recommendations=recommendations
         )
     
-    async def _generate_vessel_schedules(
+    def _generate_vessel_schedules(
         self, 
         selected_routes: List[Dict[str, Any]], 
         vessels: List[HPCLVessel]
@@ -713,6 +934,11 @@ class HPCLCPSATOptimizer:
         """
         vessel_schedules = []
         
+        # Use module-level flattened (from, to) tables imported from route_generator.
+        # Bound once here rather than re-resolved on every voyage in the schedule loop.
+        _ltu_get = TRIP_LU_FLAT.get
+        _utu_get = TRIP_UU_FLAT.get
+        
         for vessel in vessels:
             vessel_routes = [
                 route for route in selected_routes 
@@ -724,6 +950,15 @@ class HPCLCPSATOptimizer:
             current_time = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)  # Start of current month
             
             for route in vessel_routes:
+                # Per-route lookups are identical for every execution — resolve them once
+                cost_breakdown_get = route.get('cost_breakdown', {}).get
+                cargo_per_port_get = route.get('cargo_per_port', {}).get
+                discharge_ports = route['discharge_ports']
+                loading_port = route['loading_port']
+                charter_cost = cost_breakdown_get('charter_cost', 0)
+                sailing_cost = cost_breakdown_get('fuel_cost_informational', 0) / max(1, len(discharge_ports))
+                unloading_cost = cost_breakdown_get('port_charges_informational', 0) / max(1, len(discharge_ports))
+                
                 for execution in range(route.get('execution_count', 1)):
                     # ── Loading activity ──────────────────────────────────────────────
                     # BUG-M2 fix: compute loading duration from PS data (capacity / rate)
@@ -742,29 +977,25 @@ class HPCLCPSATOptimizer:
                         activity_type=ActivityType.LOADING,
                         start_time=current_time,
                         end_time=loading_end,
-                        location=route['loading_port'],
-                        description=f"Loading cargo at {route['loading_port']}",
+                        location=loading_port,
+                        description=f"Loading cargo at {loading_port}",
                         # BUG-M6 fix: 'charter_cost' is the correct key (no per-activity cost in PS)
-                        cost=route.get('cost_breakdown', {}).get('charter_cost', 0)
+                        cost=charter_cost
                     ))
                     
                     current_time = loading_end
                     
                     # Sailing activities to each discharge port
-                    # Use module-level constants imported from route_generator at top of file.
-                    # Avoids recreating the full dict on every voyage in the schedule loop.
-                    _ltu = TRIP_TIMES_LOAD_TO_UNLOAD
-                    _utu = TRIP_TIMES_UNLOAD_TO_UNLOAD
                     # BUG-M6 FIX: Guard against UnboundLocalError if route has 0 discharge ports.
                     # unloading_end is defined inside the loop; initialise before the loop
                     # so the outer `current_time = unloading_end` below is always safe.
                     unloading_end = current_time  # fallback: no-op if discharge_ports is empty
-                    for i, discharge_port in enumerate(route['discharge_ports']):
+                    for i, discharge_port in enumerate(discharge_ports):
                         if i == 0:
-                            seg_days = _ltu.get(route['loading_port'], {}).get(discharge_port, 0.5)
+                            seg_days = _ltu_get((loading_port, discharge_port), 0.5)
                         else:
-                            prev_port = route['discharge_ports'][i - 1]
-                            seg_days = _utu.get(prev_port, {}).get(discharge_port, 0.2)
+                            prev_port = discharge_ports[i - 1]
+                            seg_days = _utu_get((prev_port, discharge_port), 0.2)
                         sailing_duration = seg_days * 24.0  # convert to hours
                         sailing_end = current_time + timedelta(hours=sailing_duration)
                         
@@ -775,7 +1006,7 @@ class HPCLCPSATOptimizer:
                             location="at_sea",
                             description=f"Sailing to {discharge_port}",
                             # 'fuel_cost_informational' is the correct key in route cost_breakdown
-                            cost=route.get('cost_breakdown', {}).get('fuel_cost_informational', 0) / max(1, len(route['discharge_ports']))
+                            cost=sailing_cost
                         ))
                         
                         current_time = sailing_end
@@ -783,7 +1014,7 @@ class HPCLCPSATOptimizer:
                         # BUG-M2 fix: compute unloading duration from PS data (cargo / rate)
                         # instead of the previous hardcoded 8 hours.
                         # unloading_rate is 1500 MT/h from challenge_data.py.
-                        cargo_for_port = route.get('cargo_per_port', {}).get(discharge_port, vessel_cap / len(route['discharge_ports']))
+                        cargo_for_port = cargo_per_port_get(discharge_port, vessel_cap / len(discharge_ports))
                         unloading_duration = cargo_for_port / 1500.0  # hours = MT / (MT/h)
                         unloading_end = current_time + timedelta(hours=unloading_duration)
                         
@@ -794,7 +1025,7 @@ class HPCLCPSATOptimizer:
                             location=discharge_port,
                             description=f"Unloading cargo at {discharge_port}",
                             # BUG-M6 fix: port_charges_informational is closest informational key
-                            cost=route.get('cost_breakdown', {}).get('port_charges_informational', 0) / len(route['discharge_ports'])
+                            cost=unloading_cost
                         ))
                         
                     current_time = unloading_end
@@ -904,21 +1135,7 @@ class HPCLCPSATOptimizer:
         """
         Create result when problem is infeasible with detailed explanation
         """
-        capacity_gap = total_demand - total_capacity
-        
-        recommendations = [
-            f"⚠️ INFEASIBLE: Total demand ({total_demand:,.0f} MT) cannot be met within the monthly time budget.",
-            f"Fleet can deliver at most {total_capacity:,.0f} MT given the 720-hour/month constraint and PS trip times.",
-            f"Shortfall: {capacity_gap:,.0f} MT",
-            f"Suggested solutions:",
-            f"  1. Charter additional vessel(s) — minimum additional capacity needed: {capacity_gap:,.0f} MT over the month",
-            f"  2. The 720 h/month time budget (not a voyage count) is the binding constraint — shorter routes help",
-            f"  3. Multi-loading port operations are already restricted to single loading port per voyage (PS constraint)",
-            f"  4. Reduce demand at highest-demand ports: " + ", ".join(
-                f"{port_id} ({demand:,.0f} MT)" 
-                for port_id, demand in sorted(demand_dict.items(), key=lambda x: -x[1])[:3]
-            )
-        ]
+        recommendations = infeasibility_recommendations(total_demand, total_capacity, demand_dict)
         
         return OptimizationResult(
             request_id=f"hpcl_infeasible_{int(time.time())}",
@@ -20,6 +20,27 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+KM_TO_NM = 0.539957
+
+
+def fcc_distance_matrix_nm(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    All-pairs FCC ellipsoidal flat-earth distance (47 CFR 73.208) in nautical miles.
+    Per-degree scale factors K1/K2 are evaluated at each pair's mid-latitude, so the
+    whole NxN matrix is one broadcast expression with no per-pair Python work.
+    """
+    lat = np.asarray(latitudes, dtype=np.float64)
+    lon = np.asarray(longitudes, dtype=np.float64)
+    mid_lat = np.radians((lat[:, None] + lat[None, :]) / 2)
+    
+    # km per degree of latitude (K1) and longitude (K2)
+    k1 = 111.13209 - 0.56605 * np.cos(2 * mid_lat) + 0.00120 * np.cos(4 * mid_lat)
+    k2 = 111.41513 * np.cos(mid_lat) - 0.09455 * np.cos(3 * mid_lat) + 0.00012 * np.cos(5 * mid_lat)
+    
+    dy = k1 * (lat[:, None] - lat[None, :])
+    dx = k2 * (lon[:, None] - lon[None, :])
+    return np.sqrt(dx * dx + dy * dy) * KM_TO_NM
+
 
 class HPCLMaritimeDistanceCalculator:
     """
@@ -49,15 +70,30 @@ class HPCLMaritimeDistanceCalculator:
         self.distance_matrix = {}
         self.route_coordinates = {}
         
+        # Straight-line fallback for every pair in one vectorized pass
+        fallback_nm = fcc_distance_matrix_nm(
+            [port['latitude'] for port in ports],
+            [port['longitude'] for port in ports]
+        )
+        
+        if searoute is None:
+            # No sea routing available: the fallback matrix is the result
+            for i, origin_port in enumerate(ports):
+                self.distance_matrix[origin_port['port_id']] = {
+                    dest_port['port_id']: float(fallback_nm[i, j])
+                    for j, dest_port in enumerate(ports)
+                }
+        routed_ports = ports if searoute is not None else []
+        
         # Calculate distances for all port pairs
         total_pairs = len(ports) * (len(ports) - 1)
         calculated_pairs = 0
         
-        for origin_port in ports:
+        for i, origin_port in enumerate(routed_ports):
             origin_id = origin_port['port_id']
             self.distance_matrix[origin_id] = {}
             
-            for dest_port in ports:
+            for j, dest_port in enumerate(routed_ports):
                 dest_id = dest_port['port_id']
                 
                 if origin_id == dest_id:
@@ -83,12 +119,8 @@ class HPCLMaritimeDistanceCalculator:
                         
                 except Exception as e:
                     logger.warning(f"Failed to calculate route {origin_id} -> {dest_id}: {e}")
-                    # Use Haversine distance as fallback
-                    fallback_distance = self._haversine_distance(
-                        origin_port['latitude'], origin_port['longitude'],
-                        dest_port['latitude'], dest_port['longitude']
-                    )
-                    self.distance_matrix[origin_id][dest_id] = fallback_distance
+                    # Use FCC straight-line distance as fallback
+                    self.distance_matrix[origin_id][dest_id] = float(fallback_nm[i, j])
         
         # Prepare result
         result = {
@@ -96,7 +128,7 @@ class HPCLMaritimeDistanceCalculator:
             'route_coordinates': self.route_coordinates,
             'last_updated': datetime.now(),
             'total_ports': len(ports),
-            'calculation_method': 'searoute_with_haversine_fallback'
+            'calculation_method': 'searoute_with_fcc_fallback' if searoute is not None else 'fcc'
         }
         
         # Save to database
@@ -120,7 +152,7 @@ class HPCLMaritimeDistanceCalculator:
                 if route and hasattr(route, 'geometry') and hasattr(route, 'properties'):
                     # Extract distance (convert km to nautical miles)
                     distance_km = route.properties.get('length', 0)
-                    distance_nm = distance_km * 0.539957  # km to nautical miles
+                    distance_nm = distance_km * KM_TO_NM
                     
                     # Extract coordinates for visualization
                     coordinates = []
@@ -142,24 +174,6 @@ class HPCLMaritimeDistanceCalculator:
             logger.warning(f"Searoute failed for {origin_port['name']} -> {dest_port['name']}: {e}")
             raise e
     
-    def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """
-        Calculate Haversine distance as fallback (in nautical miles)
-        """
-        # Convert decimal degrees to radians
-        lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-        c = 2 * np.arcsin(np.sqrt(a))
-        
-        # Radius of earth in nautical miles
-        r_nm = 3440.065
-        
-        return c * r_nm
-    
     def _is_matrix_valid(self, cached_matrix: Dict, current_ports: List[Dict]) -> bool:
         """
         Check if cached distance matrix is still valid
@@ -54,6 +54,9 @@ class MaritimeGridManager:
         self.grid: Dict[Tuple[float, float], GridCell] = {}
         self.obstacle_cells: Set[Tuple[float, float]] = set()
         self.grid_initialized = False
+        self.lat_steps = 0
+        self.lon_steps = 0
+        self._statistics: Optional[Dict] = None  # Memoized get_grid_statistics() result
         
         # Precomputed neighbor offsets (8-direction movement)
         self.neighbor_offsets = [
@@ -74,6 +77,8 @@ class MaritimeGridManager:
         lat_steps = int((self.GRID_BOUNDS['lat_max'] - self.GRID_BOUNDS['lat_min']) / self.CELL_SIZE_DEGREES)
         lon_steps = int((self.GRID_BOUNDS['lon_max'] - self.GRID_BOUNDS['lon_min']) / self.CELL_SIZE_DEGREES)
         
+        self.lat_steps, self.lon_steps = lat_steps, lon_steps
+        
         logger.info(f"Grid dimensions: {lat_steps} x {lon_steps} = {lat_steps * lon_steps:,} cells")
         
         # Initialize all cells as navigable water
@@ -94,6 +99,7 @@ class MaritimeGridManager:
         if obstacles:
             self._apply_obstacles(obstacles)
         
+        self._statistics = None
         self.grid_initialized = True
         logger.info(f"Grid initialized: {len(self.grid):,} cells, {len(self.obstacle_cells)} obstacles")
     
@@ -105,6 +111,11 @@ class MaritimeGridManager:
             obstacles: List of obstacle definitions with lat, lon, radius, type
         """
         logger.info(f"Applying {len(obstacles)} obstacles to grid...")
+        self._statistics = None
+        
+        lat_min = self.GRID_BOUNDS['lat_min']
+        lon_min = self.GRID_BOUNDS['lon_min']
+        km_per_degree = np.radians(1.0) * 6371  # ~111.19 km per degree of latitude
         
         for obstacle in obstacles:
             obstacle_type = obstacle.get('type', 'island')
@@ -112,24 +123,47 @@ class MaritimeGridManager:
             center_lon = obstacle['lon']
             radius_km = obstacle.get('radius_km', 5.0)
             
-            # Convert radius to grid cells
-            radius_cells = int(radius_km / (self.CELL_SIZE_DEGREES * 111))  # 111 km per degree
+            # The grid is regular, so it is its own spatial index: only cells inside
+            # the bounding box of the 2x-radius risk zone can be affected. Great-circle
+            # distance is never shorter than the latitude arc, and the longitude span
+            # is widened for the box's most poleward row; one extra cell of margin
+            # absorbs rounding at the edges.
+            reach_km = radius_km * 2
+            dlat_deg = reach_km / km_per_degree
+            max_abs_lat = min(abs(center_lat) + dlat_deg, 89.0)
+            dlon_deg = dlat_deg / np.cos(np.radians(max_abs_lat))
+            
+            i_lo = max(0, int(np.floor((center_lat - dlat_deg - lat_min) / self.CELL_SIZE_DEGREES)) - 1)
+            i_hi = min(self.lat_steps - 1, int(np.ceil((center_lat + dlat_deg - lat_min) / self.CELL_SIZE_DEGREES)) + 1)
+            j_lo = max(0, int(np.floor((center_lon - dlon_deg - lon_min) / self.CELL_SIZE_DEGREES)) - 1)
+            j_hi = min(self.lon_steps - 1, int(np.ceil((center_lon + dlon_deg - lon_min) / self.CELL_SIZE_DEGREES)) + 1)
+            if i_lo > i_hi or j_lo > j_hi:
+                continue  # Risk zone lies entirely outside the grid
+            
+            # Same key arithmetic as initialize_grid, so lookups hit existing cells
+            lat_keys = [round(lat_min + (i * self.CELL_SIZE_DEGREES), 4) for i in range(i_lo, i_hi + 1)]
+            lon_keys = [round(lon_min + (j * self.CELL_SIZE_DEGREES), 4) for j in range(j_lo, j_hi + 1)]
+            
+            # Distances for the whole window in one vectorized haversine
+            distances = self._haversine_distance(
+                center_lat, center_lon,
+                np.array(lat_keys)[:, None], np.array(lon_keys)[None, :]
+            )
             
             # Mark cells within radius as obstacles
-            for lat_key, lon_key in self.grid.keys():
-                distance = self._haversine_distance(center_lat, center_lon, lat_key, lon_key)
-                
-                if distance <= radius_km:
-                    cell = self.grid[(lat_key, lon_key)]
-                    cell.is_navigable = False
-                    cell.obstacle_type = obstacle_type
-                    cell.risk_score = 1.0
-                    self.obstacle_cells.add((lat_key, lon_key))
-                
-                # Risk gradient for nearby cells (within 2x radius)
-                elif distance <= radius_km * 2:
-                    cell = self.grid[(lat_key, lon_key)]
-                    cell.risk_score = 0.3 * (1 - (distance - radius_km) / radius_km)
+            for a, b in zip(*np.nonzero(distances <= radius_km)):
+                key = (lat_keys[a], lon_keys[b])
+                cell = self.grid[key]
+                cell.is_navigable = False
+                cell.obstacle_type = obstacle_type
+                cell.risk_score = 1.0
+                self.obstacle_cells.add(key)
+            
+            # Risk gradient for nearby cells (within 2x radius)
+            for a, b in zip(*np.nonzero((distances > radius_km) & (distances <= reach_km))):
+                distance = float(distances[a, b])
+                cell = self.grid[(lat_keys[a], lon_keys[b])]
+                cell.risk_score = 0.3 * (1 - (distance - radius_km) / radius_km)
     
     def get_cell(self, lat: float, lon: float) -> Optional[GridCell]:
         """
@@ -221,10 +255,10 @@ class MaritimeGridManager:
         
         Args:
             lat1, lon1: First coordinate
-            lat2, lon2: Second coordinate
+            lat2, lon2: Second coordinate (scalars or broadcastable arrays)
             
         Returns:
-            Distance in kilometers
+            Distance in kilometers (array when given arrays)
         """
         lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
         
@@ -240,15 +274,29 @@ class MaritimeGridManager:
         """
         Get grid statistics
         
+        Cell states only change in initialize_grid/_apply_obstacles, so the
+        counts are computed once and reused until the grid is rebuilt.
+        
         Returns:
             Dictionary with grid statistics
         """
+        if self._statistics is not None:
+            return dict(self._statistics)
+        
         total_cells = len(self.grid)
-        navigable_cells = sum(1 for cell in self.grid.values() if cell.is_navigable)
+        navigable_cells = 0
+        risky_cells = 0
+        
+        # Single pass over the cells for both counts
+        for cell in self.grid.values():
+            if cell.is_navigable:
+                navigable_cells += 1
+            if cell.risk_score > 0.3:
+                risky_cells += 1
+        
         obstacle_cells = len(self.obstacle_cells)
-        risky_cells = sum(1 for cell in self.grid.values() if cell.risk_score > 0.3)
         
-        return {
+        self._statistics = {
             'total_cells': total_cells,
             'navigable_cells': navigable_cells,
             'obstacle_cells': obstacle_cells,
@@ -257,6 +305,7 @@ class MaritimeGridManager:
             'grid_bounds': self.GRID_BOUNDS,
             'cell_size_km': round(self.CELL_SIZE_DEGREES * 111, 2)
         }
+        return dict(self._statistics)
 
 
 # Global grid manager instance
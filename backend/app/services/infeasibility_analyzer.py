@@ -3,6 +3,7 @@ Infeasibility Analysis Engine
 Analyzes optimization failures and provides actionable suggestions
 """
 from typing import List, Dict, Any, Tuple
+from operator import itemgetter
 import logging
 
 logger = logging.getLogger(__name__)
@@ -119,7 +120,7 @@ class InfeasibilityAnalyzer:
         suggestions = []
         
         # Check for extremely high demand at single port
-        max_demand_port = max(self.demands.items(), key=lambda x: x[1])
+        max_demand_port = max(self.demands.items(), key=itemgetter(1))
         port_name, demand = max_demand_port
         total_demand = sum(self.demands.values())
         
@@ -11,12 +11,17 @@ from datetime import datetime, timedelta
 import logging
 import json
 from functools import lru_cache
+from operator import itemgetter
+from collections import OrderedDict
+
+import numpy as np
 
 from .distance_calculator import get_hpcl_route_distance, get_hpcl_route_coordinates
 from ..models.schemas import HPCLVessel, HPCLPort, HPCLRoute
 from ..data.challenge_data import (
     get_challenge_trip_times_load_to_unload,
-    get_challenge_trip_times_unload_to_unload
+    get_challenge_trip_times_unload_to_unload,
+    get_trip_time_matrices
 )
 
 # Configure logging
@@ -31,6 +36,19 @@ SINGLE_LOADING_CONSTRAINT = True
 TRIP_TIMES_LOAD_TO_UNLOAD = get_challenge_trip_times_load_to_unload()
 TRIP_TIMES_UNLOAD_TO_UNLOAD = get_challenge_trip_times_unload_to_unload()
 
+# Flattened {(from, to): days} views — one hash probe per leg instead of two
+# chained .get() calls with a throwaway {} default on misses.
+TRIP_LU_FLAT = {
+    (l, u): t for l, row in TRIP_TIMES_LOAD_TO_UNLOAD.items() for u, t in row.items()
+}
+TRIP_UU_FLAT = {
+    (u1, u2): t for u1, row in TRIP_TIMES_UNLOAD_TO_UNLOAD.items() for u2, t in row.items()
+}
+
+# Dense views of the same PS tables (float64 day matrices, built once by
+# challenge_data). Rows/columns follow LOAD_PORT_INDEX / UNLOAD_PORT_INDEX.
+TRIP_LU, TRIP_UU, LOAD_PORT_INDEX, UNLOAD_PORT_INDEX = get_trip_time_matrices()
+
 # NOTE: No service time constants — the PS trip time tables already
 # encode full trip duration (loading + sailing + unloading). Adding
 # extra service time would double-count and contradict the PS.
@@ -62,10 +80,12 @@ def calculate_trip_time_from_tables(
         return 0.0
 
     total_trip_time_days = 0.0
+    lu_get = TRIP_LU_FLAT.get
+    uu_get = TRIP_UU_FLAT.get
 
     # Step 1: Loading port to first discharge port (from PS table)
     first_discharge = discharge_port_ids[0]
-    load_to_first_unload = TRIP_TIMES_LOAD_TO_UNLOAD.get(loading_port_id, {}).get(first_discharge, 0.5)
+    load_to_first_unload = lu_get((loading_port_id, first_discharge), 0.5)
     total_trip_time_days += load_to_first_unload
 
     # Step 2: If there's a second discharge port, add inter-port sailing time (from PS table)
@@ -73,7 +93,7 @@ def calculate_trip_time_from_tables(
         for i in range(len(discharge_port_ids) - 1):
             from_port = discharge_port_ids[i]
             to_port = discharge_port_ids[i + 1]
-            unload_to_unload = TRIP_TIMES_UNLOAD_TO_UNLOAD.get(from_port, {}).get(to_port, 0.2)
+            unload_to_unload = uu_get((from_port, to_port), 0.2)
             total_trip_time_days += unload_to_unload
 
     # Step 3: include_service_time parameter is intentionally ignored.
@@ -91,7 +111,7 @@ def calculate_trip_time_from_tables(
         last_discharge = discharge_port_ids[-1]
         # Best available approximation: reverse of the forward trip time (L→U used as U→L)
         # Real U→L times are not provided by the PS.
-        return_time = TRIP_TIMES_LOAD_TO_UNLOAD.get(loading_port_id, {}).get(last_discharge, 0.5)
+        return_time = lu_get((loading_port_id, last_discharge), 0.5)
         total_trip_time_days += return_time
 
     return total_trip_time_days
@@ -110,7 +130,9 @@ class HPCLRouteGenerator:
         self.generated_routes: List[Dict[str, Any]] = []
         self.enable_pruning = enable_pruning
         self.enable_caching = enable_caching
-        self.route_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # Keyed on the full vessel/port identity (see _route_cache_key), bounded LRU
+        self.route_cache: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+        self.route_cache_maxsize = 16
         self.pruning_stats = {
             "total_generated": 0,
             "pruned_time_exceeded": 0,
@@ -142,8 +164,11 @@ class HPCLRouteGenerator:
         start_time = datetime.now()
         
         # Check cache first
-        cache_key = f"{len(vessels)}_{len(loading_ports)}_{len(unloading_ports)}_{fuel_price_per_mt}"
+        cache_key = self._route_cache_key(
+            vessels, loading_ports, unloading_ports, fuel_price_per_mt, vessel_available_hours
+        )
         if self.enable_caching and cache_key in self.route_cache:
+            self.route_cache.move_to_end(cache_key)
             logger.info(f"Using cached routes ({len(self.route_cache[cache_key])} routes)")
             return self.route_cache[cache_key]
         
@@ -203,10 +228,38 @@ class HPCLRouteGenerator:
         # Cache results
         if self.enable_caching:
             self.route_cache[cache_key] = all_routes
+            while len(self.route_cache) > self.route_cache_maxsize:
+                self.route_cache.popitem(last=False)
         
         self.generated_routes = all_routes
         return all_routes
     
+    @staticmethod
+    def _route_cache_key(
+        vessels: List[HPCLVessel],
+        loading_ports: List[HPCLPort],
+        unloading_ports: List[HPCLPort],
+        fuel_price_per_mt: float,
+        vessel_available_hours: float
+    ) -> Tuple:
+        """
+        Cache key covering every input that changes the generated routes.
+
+        The old key only used the list lengths, so two requests with the same
+        fleet size but different capacities or charter rates shared routes —
+        wrong costs as soon as one generator instance serves many requests.
+        """
+        return (
+            tuple(
+                (v.id, v.capacity_mt, v.daily_charter_rate, v.fuel_consumption_mt_per_day)
+                for v in vessels
+            ),
+            tuple((p.id, p.port_charges_per_visit) for p in loading_ports),
+            tuple((p.id, p.port_charges_per_visit) for p in unloading_ports),
+            fuel_price_per_mt,
+            vessel_available_hours
+        )
+
     def _prune_routes(
         self,
         routes: List[Dict[str, Any]],
@@ -321,7 +374,10 @@ class HPCLRouteGenerator:
         direct_routes = []
         
         for loading_port in loading_ports:
-            for unloading_port in unloading_ports:
+            # Whole L→U row for this loading port in one vectorized gather
+            direct_times, _ = self._trip_time_block(loading_port, unloading_ports)
+            
+            for u, unloading_port in enumerate(unloading_ports):
                 
                 # Calculate route metrics
                 route_data = await self._calculate_route_metrics(
@@ -329,7 +385,8 @@ class HPCLRouteGenerator:
                     loading_port=loading_port,
                     discharge_ports=[unloading_port],
                     fuel_price_per_mt=fuel_price_per_mt,
-                    route_type="direct"
+                    route_type="direct",
+                    total_time_days=None if direct_times is None else float(direct_times[u])
                 )
                 
                 if route_data:
@@ -350,18 +407,22 @@ class HPCLRouteGenerator:
         split_routes = []
         
         for loading_port in loading_ports:
+            # split_times[a, b] = L→U_a + U_a→U_b for every ordered pair at once
+            _, split_times = self._trip_time_block(loading_port, unloading_ports)
+            
             # Generate all combinations of 2 unloading ports
-            for unload_port_1, unload_port_2 in itertools.combinations(unloading_ports, 2):
+            for a, b in itertools.combinations(range(len(unloading_ports)), 2):
                 
                 # Try both orders: U1 → U2 and U2 → U1
-                for discharge_sequence in [(unload_port_1, unload_port_2), (unload_port_2, unload_port_1)]:
+                for first, second in ((a, b), (b, a)):
                     
                     route_data = await self._calculate_route_metrics(
                         vessel=vessel,
                         loading_port=loading_port,
-                        discharge_ports=list(discharge_sequence),
+                        discharge_ports=[unloading_ports[first], unloading_ports[second]],
                         fuel_price_per_mt=fuel_price_per_mt,
-                        route_type="split"
+                        route_type="split",
+                        total_time_days=None if split_times is None else float(split_times[first, second])
                     )
                     
                     if route_data:
@@ -369,13 +430,35 @@ class HPCLRouteGenerator:
         
         return split_routes
     
+    def _trip_time_block(
+        self,
+        loading_port: HPCLPort,
+        unloading_ports: List[HPCLPort]
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Gather PS trip times for one loading port against a list of unloading ports.
+
+        Returns (direct_times[U], split_times[U, U]) where split_times[a, b] is the
+        L → U_a → U_b duration. Both are None when a port is not in the PS tables,
+        in which case callers fall back to calculate_trip_time_from_tables().
+        """
+        load_idx = LOAD_PORT_INDEX.get(loading_port.id)
+        unload_idx = [UNLOAD_PORT_INDEX.get(p.id) for p in unloading_ports]
+        if load_idx is None or None in unload_idx:
+            return None, None
+
+        direct_times = TRIP_LU[load_idx, unload_idx]
+        split_times = direct_times[:, None] + TRIP_UU[np.ix_(unload_idx, unload_idx)]
+        return direct_times, split_times
+
     async def _calculate_route_metrics(
         self,
         vessel: HPCLVessel,
         loading_port: HPCLPort,
         discharge_ports: List[HPCLPort],
         fuel_price_per_mt: float,
-        route_type: str
+        route_type: str,
+        total_time_days: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Calculate complete metrics for a single route using EXACT trip time tables
@@ -384,14 +467,16 @@ class HPCLRouteGenerator:
             # Generate unique route ID
             route_id = f"HPCL_{vessel.id}_{loading_port.id}_{'_'.join([p.id for p in discharge_ports])}_{uuid.uuid4().hex[:8]}"
             
-            # Calculate EXACT trip time from challenge data tables
+            # Calculate EXACT trip time from challenge data tables (unless the
+            # caller already gathered it from the dense TRIP_LU / TRIP_UU matrices)
             discharge_port_ids = [p.id for p in discharge_ports]
-            total_time_days = calculate_trip_time_from_tables(
-                loading_port_id=loading_port.id,
-                discharge_port_ids=discharge_port_ids,
-                include_service_time=False,  # PS tables already encode full trip duration — no extra time added
-                include_return_trip=False     # Don't include return by default
-            )
+            if total_time_days is None:
+                total_time_days = calculate_trip_time_from_tables(
+                    loading_port_id=loading_port.id,
+                    discharge_port_ids=discharge_port_ids,
+                    include_service_time=False,  # PS tables already encode full trip duration — no extra time added
+                    include_return_trip=False     # Don't include return by default
+                )
             total_time_hours = total_time_days * 24.0
             
             # Calculate route segments and total distance (for visualization)
@@ -483,9 +568,7 @@ class HPCLRouteGenerator:
             }
             
         except Exception as e:
-            logger.error(f"Error calculating route metrics: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error calculating route metrics: %s", e)
             return None
     
     async def _calculate_route_segments(
@@ -650,6 +733,10 @@ class HPCLRouteOptimizer:
     
     def __init__(self):
         self.route_generator = HPCLRouteGenerator()
+        # optimization_focus -> (source route list, sorted view of it).
+        # The generator returns the same cached list for repeat inputs, so the
+        # sorted order is computed once and reused until the source changes.
+        self._sorted_route_cache: Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
     
     async def generate_optimized_route_set(
         self,
@@ -667,6 +754,10 @@ class HPCLRouteOptimizer:
             vessels, loading_ports, unloading_ports, fuel_price_per_mt
         )
         
+        cached = self._sorted_route_cache.get(optimization_focus)
+        if cached is not None and cached[0] is all_routes:
+            return cached[1]
+        
         # Apply optimization-specific filtering
         if optimization_focus == "cost":
             # Keep routes with better cost efficiency
@@ -682,6 +773,7 @@ class HPCLRouteOptimizer:
             optimized_routes = all_routes
         
         logger.info(f"Optimized route set: {len(optimized_routes)} routes (from {len(all_routes)} total)")
+        self._sorted_route_cache[optimization_focus] = (all_routes, optimized_routes)
         return optimized_routes
     
     def _filter_by_cost_efficiency(self, routes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -693,21 +785,21 @@ class HPCLRouteOptimizer:
         infeasibility. The CP-SAT solver is better positioned to select
         cost-efficient routes among all feasible options.
         """
-        return sorted(routes, key=lambda r: r.get('cost_per_mt', float('inf')))
+        return sorted(routes, key=itemgetter('cost_per_mt'))
     
     def _filter_by_time_efficiency(self, routes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Return all routes sorted by time efficiency — no routes are dropped.
         Same reasoning as _filter_by_cost_efficiency: no culling.
         """
-        return sorted(routes, key=lambda r: r.get('total_time_hours', float('inf')))
+        return sorted(routes, key=itemgetter('total_time_hours'))
     
     def _filter_by_distance_efficiency(self, routes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Return all routes sorted by distance — no routes are dropped.
         Same reasoning as _filter_by_cost_efficiency: no culling.
         """
-        return sorted(routes, key=lambda r: r.get('total_distance_nm', float('inf')))
+        return sorted(routes, key=itemgetter('total_distance_nm'))
 
 
 # Initialize global route generator
@@ -13,8 +13,12 @@ import logging
 
 from ..core.celery_app import app, HPCLTaskPriority
 from ..models.schemas import OptimizationRequest, HPCLVessel, HPCLPort, MonthlyDemand
-from ..models.database import HPCLVesselDB, HPCLPortDB, OptimizationResultDB, TaskDB
-from ..services.cp_sat_optimizer import HPCLCPSATOptimizer
+from ..models.database import (
+    HPCLVesselDB, HPCLPortDB, OptimizationResultDB, TaskDB,
+    connect_to_mongo, close_mongo_connection
+)
+from ..services.cp_sat_optimizer import HPCLCPSATOptimizer, warm_start_hints_from_document
+from ..core.ids import optimization_request_hash
 from ..services.distance_calculator import calculate_hpcl_distance_matrix
 
 logger = logging.getLogger(__name__)
@@ -28,7 +32,7 @@ logger = logging.getLogger(__name__)
     soft_time_limit=600,
     time_limit=900
 )
-def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], solver_profile: str = "balanced"):
+def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], solver_profile: str = "quick"):
     """
     Main HPCL fleet optimization task with result persistence
     
@@ -42,7 +46,7 @@ def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], s
     Args:
         task_id: Unique task identifier (used as result_id)
         request_data: Optimization request parameters
-        solver_profile: Solver configuration profile (quick/balanced/thorough/production)
+        solver_profile: Key of settings.solver_profiles (quick/optimal)
     
     Returns:
         result_id for polling via /api/v1/results/{id}
@@ -94,6 +98,11 @@ def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], s
             if len(unloading_ports_data) != 11:
                 raise ValueError(f"HPCL port configuration error. Expected 11 unloading ports, found {len(unloading_ports_data)}")
             
+            # Fingerprint of the request and the fleet/port records being solved
+            request_hash = optimization_request_hash(
+                request.model_dump(mode="json"), vessels_data, loading_ports_data + unloading_ports_data
+            )
+            
             # Convert to schemas
             vessels = [HPCLVessel(**vessel) for vessel in vessels_data]
             loading_ports = [HPCLPort(**port) for port in loading_ports_data]
@@ -116,6 +125,9 @@ def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], s
             # Initialize optimizer with profile
             optimizer = HPCLCPSATOptimizer(solver_profile=solver_profile)
             
+            # Warm-start from the month's last solution, if any
+            previous_result = await OptimizationResultDB.get_latest_solved_result_for_month(request.month)
+            
             # Run optimization
             result = await optimizer.optimize_hpcl_fleet(
                 vessels=available_vessels,
@@ -124,7 +136,8 @@ def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], s
                 monthly_demands=request.demands,
                 fuel_price_per_mt=request.fuel_price_per_mt,
                 optimization_objective=request.optimize_for,
-                max_solve_time_seconds=request.max_solve_time_seconds
+                max_solve_time_seconds=request.max_solve_time_seconds,
+                warm_start_hints=warm_start_hints_from_document(previous_result) if previous_result else None
             )
             
             await TaskDB.update_task_status(task_id, "processing", 95, "Saving optimization results...")
@@ -132,7 +145,9 @@ def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], s
             
             # Add metadata to result
             result.request_id = result_id
-            result_dict = result.dict()
+            result.month = request.month
+            result_dict = result.model_dump()
+            result_dict["request_hash"] = request_hash
             result_dict["metadata"] = {
                 "solver_profile": solver_profile,
                 "task_id": task_id,
@@ -145,8 +160,8 @@ def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], s
                 "total_time_seconds": optimizer.metrics.get("total_time", 0)
             }
             
-            # Save to database for polling
-            await OptimizationResultDB.save_result(result_id, result_dict)
+            # Save to database for polling (result_dict carries request_id=result_id)
+            await OptimizationResultDB.save_result(result_dict)
             
             await TaskDB.update_task_status(task_id, "completed", 100, "Optimization completed successfully")
             
@@ -195,11 +210,21 @@ def optimize_hpcl_fleet_task(self, task_id: str, request_data: Dict[str, Any], s
         await TaskDB.update_task_status(task_id, "processing", progress, message)
         current_task.update_state(state='PROGRESS', meta={'progress': progress, 'message': message})
     
+    async def _run_with_database():
+        # Motor clients are bound to the loop they are created on, and each task
+        # runs on a fresh loop — connect per task so status and results land in
+        # the same MongoDB the API polls.
+        await connect_to_mongo()
+        try:
+            return await _run_optimization()
+        finally:
+            await close_mongo_connection()
+    
     # Run async optimization
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     try:
-        return loop.run_until_complete(_run_optimization())
+        return loop.run_until_complete(_run_with_database())
     finally:
         loop.close()
 
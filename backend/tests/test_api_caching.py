@@ -0,0 +1,111 @@
+"""
+Test the API's result and read caches.
+Cached reads must be dropped when the data behind them changes, and
+identical solves must be served once.
+"""
+
+import pytest
+import asyncio
+from collections import OrderedDict
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api import routes, challenge_routes
+from app.api.challenge_routes import OptimizationInput, DemandInput
+from app.core.ids import optimization_request_hash
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_serves_until_invalidated():
+    """A cached read calls its loader once until the key is invalidated"""
+    calls = []
+
+    async def load():
+        calls.append(1)
+        return len(calls)
+
+    try:
+        assert await routes._ttl_cached("test-key", 60.0, load) == 1
+        assert await routes._ttl_cached("test-key", 60.0, load) == 1
+        assert len(calls) == 1
+
+        routes._ttl_invalidate("test-key")
+        assert await routes._ttl_cached("test-key", 60.0, load) == 2
+    finally:
+        routes._ttl_invalidate("test-key")
+
+
+def test_fleet_cache_invalidated_on_status_update():
+    """A vessel status change shows up in the next /fleet read, not after the TTL"""
+    with TestClient(app) as client:
+        def t1_status():
+            vessels = client.get("/api/v1/fleet").json()["vessels"]
+            return next(v["status"] for v in vessels if v["id"] == "T1")
+
+        assert t1_status() == "available"
+        try:
+            response = client.put("/api/v1/fleet/vessel/T1/status", params={"status": "maintenance"})
+            assert response.status_code == 200
+            assert t1_status() == "maintenance"
+        finally:
+            client.put("/api/v1/fleet/vessel/T1/status", params={"status": "available"})
+        assert t1_status() == "available"
+
+
+def test_request_hash_changes_with_fleet_state():
+    """A stored /optimize result is only reused for the same request over the same fleet"""
+    request = {"month": "2025-11", "demands": [{"port_id": "U1", "demand_mt": 40000}]}
+    vessels = [{"id": "T1", "status": "available"}, {"id": "T2", "status": "available"}]
+    ports = [{"id": "L1", "type": "loading"}, {"id": "U1", "type": "unloading"}]
+
+    base = optimization_request_hash(request, vessels, ports)
+    # Record order does not matter
+    assert optimization_request_hash(request, vessels[::-1], ports[::-1]) == base
+    # A vessel going to maintenance does
+    in_maintenance = [{"id": "T1", "status": "maintenance"}, vessels[1]]
+    assert optimization_request_hash(request, in_maintenance, ports) != base
+    # So does any change to the request itself
+    other_request = {**request, "demands": [{"port_id": "U1", "demand_mt": 45000}]}
+    assert optimization_request_hash(other_request, vessels, ports) != base
+
+
+def test_solve_cache_evicts_least_recently_used(monkeypatch):
+    """The challenge solve LRU drops the entry read least recently, and stamps hits fresh"""
+    monkeypatch.setattr(challenge_routes, "_SOLVE_CACHE", OrderedDict())
+    monkeypatch.setattr(challenge_routes, "_SOLVE_CACHE_MAXSIZE", 2)
+
+    for key in (b"a", b"b"):
+        challenge_routes._solve_cache_put(key, {"status": "success", "key": key.decode(), "timestamp": "old"})
+    assert challenge_routes._solve_cache_get(b"a") is not None  # a is now most recent
+    challenge_routes._solve_cache_put(b"c", {"status": "success", "key": "c"})
+
+    assert challenge_routes._solve_cache_get(b"b") is None
+    hit = challenge_routes._solve_cache_get(b"a")
+    assert hit.startswith(b'{"status":"success","key":"a","timestamp":')
+    assert b'"old"' not in hit
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_solves_are_coalesced(monkeypatch):
+    """Identical requests in flight share one solve; repeats are served from the cache"""
+    monkeypatch.setattr(challenge_routes, "_SOLVE_CACHE", OrderedDict())
+    solves = []
+
+    async def fake_solve(input_data):
+        solves.append(input_data)
+        await asyncio.sleep(0.05)
+        return {"status": "success", "summary": {"total_trips": 1}, "timestamp": "t"}
+
+    monkeypatch.setattr(challenge_routes, "_solve_challenge", fake_solve)
+    input_data = OptimizationInput(demands=[DemandInput(port_id="U1", demand_mt=40000)])
+
+    first, second = await asyncio.gather(
+        challenge_routes.run_challenge_optimization(input_data),
+        challenge_routes.run_challenge_optimization(input_data),
+    )
+    assert len(solves) == 1
+    assert first.body == second.body
+    assert not challenge_routes._PENDING_SOLVES
+
+    await challenge_routes.run_challenge_optimization(input_data)
+    assert len(solves) == 1
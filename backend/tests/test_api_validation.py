@@ -0,0 +1,75 @@
+"""
+Test request validation errors.
+Invalid bodies are rejected with 422 and FastAPI's error list, located under "body".
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_challenge_optimize_invalid_field_is_422(client):
+    """Bodies validated straight from JSON bytes keep FastAPI's error shape"""
+    response = client.post(
+        "/api/v1/challenge/optimize",
+        json={"vessels": [{"id": "T1", "capacity_mt": "lots", "charter_rate_cr_per_day": 0.5}]}
+    )
+    assert response.status_code == 422
+
+    errors = response.json()["detail"]
+    assert len(errors) == 1
+    assert errors[0]["loc"] == ["body", "vessels", 0, "capacity_mt"]
+    assert errors[0]["type"] == "int_parsing"
+    assert "msg" in errors[0]
+    assert "url" not in errors[0]
+
+
+def test_challenge_optimize_unknown_field_is_422(client):
+    """Input records forbid extra keys instead of silently dropping them"""
+    response = client.post(
+        "/api/v1/challenge/optimize",
+        json={"demands": [{"port_id": "U1", "demand_mt": 40000, "priority": "high"}]}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "demands", 0, "priority"]
+
+
+def test_challenge_optimize_malformed_json_is_422(client):
+    response = client.post(
+        "/api/v1/challenge/optimize",
+        content=b'{"demands": [',
+        headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_optimize_request_limits_are_422(client):
+    """HPCL limits on OptimizationRequest are enforced while parsing the body"""
+    too_many_demands = [{"port_id": f"U{i}", "demand_mt": 10000} for i in range(1, 13)]
+    response = client.post(
+        "/api/v1/optimize",
+        json={"month": "2025-11", "demands": too_many_demands}
+    )
+    assert response.status_code == 422
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["body", "demands"]
+    assert error["type"] == "too_long"
+
+    response = client.post(
+        "/api/v1/optimize",
+        json={
+            "month": "2025-11",
+            "demands": [{"port_id": "U1", "demand_mt": 40000}],
+            "fuel_price_per_mt": 5000
+        }
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "fuel_price_per_mt"]
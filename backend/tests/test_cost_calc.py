@@ -6,6 +6,7 @@ No port charges or fuel costs are added to total_cost.
 
 import pytest
 from app.services.route_generator import calculate_trip_time_from_tables
+from app.api.challenge_routes import _split_paise, CENTIHOURS_PER_DAY
 
 
 def test_cost_formula_charter_only():
@@ -79,5 +80,24 @@ def test_round_trip_calculation():
     )
 
 
+def test_paise_split_sums_to_trip_cost():
+    """
+    A multi-port trip's cost is split across its output rows in integer paise.
+    The shares must add back to the trip cost exactly, for any remainder.
+    """
+    # ₹51 lakh/day tanker on a 2-port trip of 37.13 h, as in the output loop
+    charter_rate_paise_per_day = 5100000 * 100
+    trip_cost_paise = charter_rate_paise_per_day * 3713 // CENTIHOURS_PER_DAY
+
+    for parts in (1, 2, 3):
+        shares = _split_paise(trip_cost_paise, parts)
+        assert len(shares) == parts
+        assert sum(shares) == trip_cost_paise
+        assert max(shares) - min(shares) <= 1, "Leftover paise are spread one per row"
+
+    # Odd amount: the leftover paisa goes to the first row
+    assert _split_paise(7, 2) == [4, 3]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,30 @@
+"""
+Test UUIDv7 task ids.
+Ids carry the creation time and sort in creation order.
+"""
+
+import time
+import uuid
+
+from app.core.ids import uuid7
+
+
+def test_uuid7_version_and_variant():
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_creation_time():
+    before_ms = time.time_ns() // 1_000_000
+    value = uuid7()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert before_ms <= value.int >> 80 <= after_ms + 1
+
+
+def test_uuid7_strictly_increasing():
+    """Ids from one process are strictly increasing, even within one millisecond"""
+    ids = [uuid7() for _ in range(10000)]
+    assert all(a < b for a, b in zip(ids, ids[1:]))
+    assert [str(i) for i in ids] == sorted(str(i) for i in ids)
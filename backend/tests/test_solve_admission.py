@@ -0,0 +1,42 @@
+"""
+Test in-process /optimize admission.
+Accepted solves hold a slot until their background task ends; beyond the
+slot count requests get 429 with Retry-After.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api import routes
+
+
+def _request(demand_mt: int) -> dict:
+    return {"month": "2025-11", "demands": [{"port_id": "U1", "demand_mt": demand_mt}]}
+
+
+def test_solves_not_yet_started_count_against_slots(monkeypatch):
+    started = []
+
+    async def not_started_yet(task_id, request):
+        # Stands in for a background task still waiting to run: the slot stays taken
+        started.append(task_id)
+
+    monkeypatch.setattr(routes, "_run_optimization_background", not_started_yet)
+    monkeypatch.setattr(routes, "_IN_PROCESS_SOLVE_SLOTS", 1)
+    monkeypatch.setattr(routes, "_in_process_solves", 0)
+
+    with TestClient(app) as client:
+        first = client.post("/api/v1/optimize", json=_request(40000))
+        assert first.status_code == 200
+        assert first.json()["status"] == "submitted"
+
+        second = client.post("/api/v1/optimize", json=_request(45000))
+        assert second.status_code == 429
+        assert second.headers["Retry-After"] == str(routes.SOLVE_RETRY_AFTER_SECONDS)
+
+        # Once the accepted solve ends, its slot is free again
+        routes._release_in_process_solve()
+        third = client.post("/api/v1/optimize", json=_request(45000))
+        assert third.status_code == 200
+
+    assert len(started) == 2
@@ -0,0 +1,73 @@
+"""
+Test TaskProgressBuffer write coalescing.
+Progress updates are batched, and the terminal state is always the last write.
+"""
+
+import pytest
+import asyncio
+
+from app.models import database
+from app.models.database import TaskProgressBuffer
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record TaskDB writes; each write takes 50 ms"""
+    log = []
+
+    async def update_task_status(task_id, status, progress, message):
+        log.append(("start", status, progress))
+        await asyncio.sleep(0.05)
+        log.append(("end", status, progress))
+
+    monkeypatch.setattr(database.TaskDB, "update_task_status", staticmethod(update_task_status))
+    return log
+
+
+@pytest.mark.asyncio
+async def test_updates_coalesce_to_latest(writes):
+    buffer = TaskProgressBuffer("task", flush_interval=0.02)
+    for progress in (10, 20, 30):
+        buffer.set("processing", progress, "working")
+    await asyncio.sleep(0.1)
+
+    assert writes == [("start", "processing", 30), ("end", "processing", 30)]
+
+
+@pytest.mark.asyncio
+async def test_finish_cancels_sleeping_flush(writes):
+    buffer = TaskProgressBuffer("task", flush_interval=0.5)
+    buffer.set("processing", 50, "working")
+    await buffer.finish("completed", 100, "done")
+
+    assert writes == [("start", "completed", 100), ("end", "completed", 100)]
+
+
+@pytest.mark.asyncio
+async def test_finish_waits_for_in_flight_flush(writes):
+    """A progress write already sent must complete before the terminal write starts"""
+    buffer = TaskProgressBuffer("task", flush_interval=0.01)
+    buffer.set("processing", 50, "working")
+    await asyncio.sleep(0.03)  # flush is now mid-write
+    await buffer.finish("completed", 100, "done")
+
+    assert writes == [
+        ("start", "processing", 50), ("end", "processing", 50),
+        ("start", "completed", 100), ("end", "completed", 100),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_finish_skips_terminal_write(writes):
+    """Cancelling finish() while it waits for a flush stops it before the terminal write"""
+    buffer = TaskProgressBuffer("task", flush_interval=0.01)
+    buffer.set("processing", 50, "working")
+    await asyncio.sleep(0.03)  # flush is now mid-write
+    finishing = asyncio.create_task(buffer.finish("completed", 100, "done"))
+    await asyncio.sleep(0)
+    finishing.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await finishing
+    await asyncio.sleep(0.1)
+
+    assert ("start", "completed", 100) not in writes
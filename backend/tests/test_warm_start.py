@@ -0,0 +1,75 @@
+"""
+Test CP-SAT warm-start hints.
+Hints are route execution counts keyed by vessel, loading port and discharge ports.
+"""
+
+from app.models.schemas import HPCLVessel
+from app.services.cp_sat_optimizer import (
+    greedy_warm_start_hints,
+    route_hint_key,
+    warm_start_hints_from_document
+)
+
+
+def _vessel(vessel_id: str, capacity_mt: int, monthly_available_hours: float) -> HPCLVessel:
+    return HPCLVessel(
+        id=vessel_id,
+        name=f"Test Vessel {vessel_id}",
+        imo_number="IMO1000001",
+        capacity_mt=capacity_mt,
+        grt=25000,
+        length_m=200,
+        beam_m=32,
+        draft_m=12,
+        speed_knots=14,
+        fuel_consumption_mt_per_day=25,
+        daily_charter_rate=5000000,
+        crew_size=20,
+        monthly_available_hours=monthly_available_hours
+    )
+
+
+def _route(vessel_id, discharge_ports, capacity_mt, total_cost, total_time_hours):
+    return {
+        "vessel_id": vessel_id,
+        "loading_port": "L1",
+        "discharge_ports": discharge_ports,
+        "vessel_capacity_mt": capacity_mt,
+        "total_cost": total_cost,
+        "total_time_hours": total_time_hours
+    }
+
+
+def test_hints_from_document_sum_repeated_patterns():
+    """Stored results list a route once per selection; counts for the same pattern add up"""
+    result_data = {
+        "selected_routes": [
+            {"vessel_id": "T1", "loading_port": "L1", "discharge_ports": ["U1"], "execution_count": 2},
+            {"vessel_id": "T1", "loading_port": "L1", "discharge_ports": ["U1"], "execution_count": 1},
+            {"vessel_id": "T2", "loading_port": "L2", "discharge_ports": ["U1", "U2"], "execution_count": 1},
+        ]
+    }
+    assert warm_start_hints_from_document(result_data) == {
+        "T1:L1:U1": 3,
+        "T2:L2:U1+U2": 1,
+    }
+
+
+def test_greedy_hints_use_cheapest_direct_trips():
+    """Largest demand first, on the cheapest route per MT that still has hours left"""
+    vessels = [_vessel("T1", 50000, 720), _vessel("T2", 25000, 720)]
+    routes = [
+        # T1 is cheaper per MT but only has time for one 500 h trip
+        _route("T1", ["U1"], 50000, 5_000_000, 500),
+        _route("T2", ["U1"], 25000, 5_000_000, 100),
+        _route("T2", ["U2"], 25000, 4_000_000, 100),
+        # Two-port routes are never hinted by the greedy pass
+        _route("T1", ["U1", "U2"], 50000, 1_000_000, 10),
+    ]
+    hints = greedy_warm_start_hints(routes, {"U1": 100000, "U2": 20000}, vessels)
+
+    assert hints == {
+        route_hint_key("T1", "L1", ["U1"]): 1,
+        route_hint_key("T2", "L1", ["U1"]): 2,
+        route_hint_key("T2", "L1", ["U2"]): 1,
+    }